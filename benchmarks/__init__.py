@@ -0,0 +1 @@
+"""Benchmarks for the leak_defense integration."""
@@ -0,0 +1,61 @@
+"""
+Benchmark GetV3 response parsing.
+
+Compares decoding the body to Python objects and building the models by keyword
+against validating the raw bytes in one pass, for accounts with 1, 10 and 100
+panels.
+
+Run from the repository root with ``python -m benchmarks.bench_parse``.
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import TYPE_CHECKING
+
+from custom_components.leak_defense.models import Customer, CustomerResponse
+
+from .payloads import make_customer_body
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PANEL_COUNTS = (1, 10, 100)
+REPEAT = 5
+
+
+def parse_keyword(body: bytes) -> Customer:
+    """Parse the body the way the client used to: json, then keyword models."""
+    return Customer(**json.loads(body).get("customer"))
+
+
+def parse_bytes(body: bytes) -> Customer:
+    """Parse the body by validating the raw bytes."""
+    return CustomerResponse.model_validate_json(body).customer
+
+
+def time_per_call(func: Callable[[bytes], Customer], body: bytes) -> float:
+    """Return the best observed time per call in milliseconds."""
+    timer = timeit.Timer(lambda: func(body))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1000
+
+
+def main() -> None:
+    """Print the parse time per poll for each account size."""
+    print(f"{'panels':>6} {'bytes':>9} {'keyword ms':>11} {'bytes ms':>9} speedup")
+    for panel_count in PANEL_COUNTS:
+        body = make_customer_body(panel_count)
+        keyword = time_per_call(parse_keyword, body)
+        raw = time_per_call(parse_bytes, body)
+        print(
+            f"{panel_count:>6} {len(body):>9} {keyword:>11.3f} {raw:>9.3f} "
+            f"{keyword / raw:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Synthetic Leak Defense API payloads for benchmarks."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def make_panel(panel_id: int) -> dict[str, Any]:
+    """Return a panel view model shaped like the ones sent by GetV3."""
+    return {
+        "clearAlarmMessage": "Are you sure you want to clear the alarm?",
+        "poldAlarmName": None,
+        "poldAlarmMesage": None,
+        "showClearAlarm": False,
+        "waterOn": True,
+        "canRecieveCmd": True,
+        "offline": False,
+        "tooCold": False,
+        "poldMissingLabels": False,
+        "scene": "HOME",
+        "activeScene": "HOME",
+        "flowValue": 0.0,
+        "tripValue": 15.0,
+        "countdownTimer": 30.0,
+        "timeToAlarm": 0.0,
+        "maxTimeValue": 240.0,
+        "updatedDate": "2024-12-01T12:00:00",
+        "totalPold": 2,
+        "apiSource": 2,
+        "updateInterval": 60,
+        "sendCmdMessage": None,
+        "poldBatteryLow": False,
+        "poldAlarmId": None,
+        "poldInfoMesage": None,
+        "address1": f"{panel_id} Main Street",
+        "address2": "",
+        "city": "Springfield",
+        "state": "IL",
+        "zip": "62701",
+        "noDataHistory": False,
+        "sortOrder": panel_id,
+        "utcDate": "2024-12-01T18:00:00Z",
+        "standbyMinRemain": 0.0,
+        "standbyMinExhausted": 0.0,
+        "stanbyMinTotal": 0.0,
+        "standbyPctExhausted": 0.0,
+        "canCancelStandby": False,
+        "waterOnByStandby": False,
+        "polds": [
+            {
+                "id": panel_id * 10 + index,
+                "name": name,
+                "inAlarm": False,
+                "batteryLow": False,
+                "offline": False,
+                "lastSeen": "2024-12-01T11:58:00",
+            }
+            for index, name in enumerate(("Kitchen", "Laundry"), start=1)
+        ],
+        "needsUpdate": False,
+        "needsUpdateMsg": None,
+        "hasWiredSensor": False,
+        "wiredSensorName": None,
+        "waterOnLabel": "Water On",
+        "waterOffLabel": "Water Off",
+        "alarmAlertMuted": False,
+        "alarmAlertMutedEnd": None,
+        "alarmAlertMuteEndUtc": "0001-01-01T00:00:00",
+        "alarmAlertMuteDuration": None,
+        "canMuteAlarmAlert": False,
+        "canUnMuteAlarmAlert": False,
+        "batAlertMuted": False,
+        "batAlertMutedEnd": None,
+        "batAlertMuteEndUtc": "0001-01-01T00:00:00",
+        "batAlertMuteDuration": None,
+        "schedulingAlartMuted": False,
+        "schedulingAlartMutedEnd": None,
+        "schedulingAlartMutedEndUtc": "0001-01-01T00:00:00",
+        "schedulingAlartMuteDuration": None,
+        "deviceOfflineMuted": False,
+        "deviceOfflineMutedEnd": None,
+        "deviceOfflineMuteEndUtc": "0001-01-01T00:00:00",
+        "deviceOfflineMuteDuration": None,
+        "coldAlertMuted": False,
+        "coldAlertMutedEnd": None,
+        "coldAlertMuteEndUtc": "0001-01-01T00:00:00",
+        "coldAlertMuteDuration": None,
+        "windowsZoneName": "Central Standard Time",
+        "ianaZoneName": "America/Chicago",
+        "fallbackScene": None,
+        "runningSchedules": 0,
+        "schedulingEnabled": False,
+        "samePoldMute": False,
+        "b0Set": True,
+        "shareCount": 0,
+        "lastEmail": "2024-11-30T08:00:00",
+        "lastSMS": None,
+        "lastPush": "2024-11-30T08:00:00",
+        "id": panel_id,
+        "mainUserId": "00000000-0000-0000-0000-000000000000",
+        "mainUserEmail": "owner@example.com",
+        "shared": False,
+        "isLDA": False,
+        "inAlarm": False,
+        "alarmType": 0,
+        "alarmHeader": None,
+        "alarmMessage": "",
+        "infoMesage": "",
+        "textIdentifier": f"Panel {panel_id}",
+    }
+
+
+def make_customer_response(panel_count: int) -> dict[str, Any]:
+    """Return a GetV3 response body for an account with ``panel_count`` panels."""
+    return {
+        "customer": {
+            "id": "00000000-0000-0000-0000-000000000000",
+            "firstName": "Jane",
+            "middleName": None,
+            "lastName": "Doe",
+            "phoneNumber": "5555555555",
+            "email": "owner@example.com",
+            "pushNotifications": True,
+            "smsNotifications": False,
+            "emailNotifications": True,
+            "phoneNumberConfirmed": True,
+            "confirmInProgress": 0,
+            "additionalUsers": [],
+            "panels": [make_panel(panel_id) for panel_id in range(1, panel_count + 1)],
+            "allowedFeatures": [],
+            "newFeatures": [],
+            "requireAcceptTerms": False,
+            "requireAcceptPrivacy": False,
+            "showTutorial": False,
+        },
+        "iOSVersion": "6.0",
+        "androidVersion": "6.0",
+        "inMaint": "false",
+    }
+
+
+def make_customer_body(panel_count: int) -> bytes:
+    """Return the encoded GetV3 response body for ``panel_count`` panels."""
+    return json.dumps(make_customer_response(panel_count)).encode()
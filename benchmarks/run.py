@@ -0,0 +1,246 @@
+"""
+Benchmark suite for the API client and coordinator.
+
+Runs against the local stub server and measures poll latency, parse CPU time,
+memory per panel, entity update fan-out and scene command round trips for
+accounts of several sizes. Results are written to ``benchmarks/results`` as
+JSON and compared with the saved baseline, if there is one.
+
+Run from the repository root with ``python -m benchmarks.run``; add
+``--save-baseline`` to record the results as the new baseline.
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from custom_components.leak_defense.api import LeakDefenseApiClient
+from custom_components.leak_defense.binary_sensor import (
+    PanelInAlarmEntity,
+    PanelOfflineEntity,
+    PanelSuspectedLeakEntity,
+    PanelTooColdEntity,
+    WaterValveEntity,
+)
+from custom_components.leak_defense.coordinator import _changed_fields
+from custom_components.leak_defense.models import (
+    CustomerResponse,
+    CustomerStateResponse,
+    SceneEnum,
+)
+from custom_components.leak_defense.sensor import (
+    PanelFlowValueSensor,
+    PanelSceneSensor,
+    PanelTripValueSensor,
+)
+
+from .payloads import make_customer_body, make_customer_response
+from .stub_server import StubConfig, start_stub_server
+
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINE = RESULTS_DIR / "baseline.json"
+LATEST = RESULTS_DIR / "latest.json"
+
+PANEL_COUNTS = (1, 10, 100)
+ITERATIONS = 50
+PANEL_ENTITIES = (
+    PanelSceneSensor,
+    PanelFlowValueSensor,
+    PanelTripValueSensor,
+    WaterValveEntity,
+    PanelTooColdEntity,
+    PanelOfflineEntity,
+    PanelInAlarmEntity,
+    PanelSuspectedLeakEntity,
+)
+
+
+def _client(session: aiohttp.ClientSession, base_url: str) -> LeakDefenseApiClient:
+    client = LeakDefenseApiClient(
+        session=session,
+        token="token",  # noqa: S106
+        device_hash="hash",
+        # Measure the round trip itself, not the command debounce window.
+        scene_debounce=0,
+    )
+    client._base_url = base_url  # noqa: SLF001
+    return client
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Return median and 95th percentile of samples in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+    }
+
+
+async def bench_poll_latency(panel_count: int) -> dict[str, float]:
+    """Time async_get_data end to end against the stub."""
+    runner, base_url = await start_stub_server(
+        StubConfig(panel_count=panel_count, vary=True)
+    )
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = _client(session, base_url)
+            samples = []
+            for _ in range(ITERATIONS):
+                start = time.perf_counter()
+                await client.async_get_data()
+                samples.append(time.perf_counter() - start)
+    finally:
+        await runner.cleanup()
+    return _summary(samples)
+
+
+async def bench_scene_round_trip(panel_count: int) -> dict[str, float]:
+    """Time async_send_scene with a fresh snapshot against the stub."""
+    runner, base_url = await start_stub_server(StubConfig(panel_count=panel_count))
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = _client(session, base_url)
+            snapshot = (await client.async_get_data()).panels[0]
+            samples = []
+            for index in range(ITERATIONS):
+                scene = SceneEnum.AWAY if index % 2 else SceneEnum.HOME
+                start = time.perf_counter()
+                await client.async_send_scene(
+                    scene,
+                    snapshot.id,
+                    snapshot=snapshot,
+                    snapshot_age=client.max_snapshot_age,
+                )
+                samples.append(time.perf_counter() - start)
+    finally:
+        await runner.cleanup()
+    return _summary(samples)
+
+
+def bench_parse_cpu(panel_count: int) -> dict[str, float]:
+    """Measure CPU time spent validating one GetV3 body as the client does."""
+    body = make_customer_body(panel_count)
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        CustomerStateResponse.model_validate_json(body)
+    return {"cpu_ms": (time.process_time() - start) / ITERATIONS * 1000}
+
+
+def _traced_parse(
+    model: type[CustomerResponse | CustomerStateResponse], body: bytes
+) -> tuple[int, int]:
+    """Return the memory retained by and allocated while parsing a body."""
+    gc.collect()
+    tracemalloc.start()
+    customer = model.model_validate_json(body).customer
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del customer
+    return retained, peak
+
+
+def bench_memory_per_panel(panel_count: int) -> dict[str, float]:
+    """
+    Measure memory per panel for the snapshots kept by the coordinator.
+
+    The full Panel model is measured alongside for comparison; the peak is
+    what a single poll allocates.
+    """
+    body = make_customer_body(panel_count)
+    retained, peak = _traced_parse(CustomerStateResponse, body)
+    full_retained, full_peak = _traced_parse(CustomerResponse, body)
+    return {
+        "bytes_per_panel": retained / panel_count,
+        "peak_bytes_per_panel": peak / panel_count,
+        "full_model_bytes_per_panel": full_retained / panel_count,
+        "full_model_peak_bytes_per_panel": full_peak / panel_count,
+    }
+
+
+def bench_fan_out(panel_count: int) -> dict[str, float]:
+    """Time diffing two snapshots and deciding which entities write state."""
+    previous = CustomerStateResponse.model_validate(make_customer_response(panel_count))
+    changed = make_customer_response(panel_count)
+    for panel in changed["customer"]["panels"]:
+        panel["flowValue"] = 1.5
+        panel["updatedDate"] = "2024-12-01T12:00:30"
+    current = CustomerStateResponse.model_validate(changed)
+    old_panels = {panel.id: panel for panel in previous.customer.panels}
+    new_panels = {panel.id: panel for panel in current.customer.panels}
+
+    writes = 0
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        writes = 0
+        for panel_id, panel in new_panels.items():
+            fields = _changed_fields(old_panels[panel_id], panel)
+            writes += sum(
+                1
+                for entity in PANEL_ENTITIES
+                if not fields.isdisjoint(entity._panel_fields)  # noqa: SLF001
+            )
+    elapsed = (time.perf_counter() - start) / ITERATIONS
+    return {
+        "fan_out_ms": elapsed * 1000,
+        "state_writes": writes,
+        "entities": len(PANEL_ENTITIES) * panel_count,
+    }
+
+
+async def run_suite() -> dict[str, Any]:
+    """Run every benchmark for every account size."""
+    results: dict[str, Any] = {}
+    for panel_count in PANEL_COUNTS:
+        results[str(panel_count)] = {
+            "poll_latency": await bench_poll_latency(panel_count),
+            "parse": bench_parse_cpu(panel_count),
+            "memory": bench_memory_per_panel(panel_count),
+            "fan_out": bench_fan_out(panel_count),
+            "scene_round_trip": await bench_scene_round_trip(panel_count),
+        }
+    return results
+
+
+def report(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """Print the results with the relative change against the baseline."""
+    for panel_count, groups in results.items():
+        print(f"{panel_count} panel(s)")
+        for group, metrics in groups.items():
+            for metric, value in metrics.items():
+                line = f"  {group}.{metric}: {value:.3f}"
+                base = (baseline or {}).get(panel_count, {}).get(group, {}).get(metric)
+                if base:
+                    line += f" ({(value - base) / base:+.1%} vs baseline)"
+                print(line)
+
+
+def main() -> None:
+    """Run the suite, store the results and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite())
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else None
+    report(results, baseline)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    LATEST.write_text(json.dumps(results, indent=2) + "\n")
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
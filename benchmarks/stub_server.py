@@ -0,0 +1,157 @@
+"""
+Local stand-in for the Leak Defense cloud API.
+
+Serves ``/Account/Token``, ``/Customer/GetV3`` and ``/Command/SetScene`` for a
+generated account with a configurable number of panels, response latency and
+failure rate, so the API client and coordinator can be exercised offline.
+
+Run it standalone from the repository root with
+``python -m benchmarks.stub_server --panels 10 --latency 0.2``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+from .payloads import make_customer_response
+
+API_PATH = "/mobile-hex-api/api"
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub server."""
+
+    panel_count: int = 1
+    latency: float = 0.0
+    failure_rate: float = 0.0
+    # Change every panel's updatedDate on each GetV3 so the client cannot
+    # short-circuit unchanged payloads.
+    vary: bool = False
+    seed: int | None = None
+
+
+@dataclass
+class StubState:
+    """Mutable account state served by the stub."""
+
+    config: StubConfig
+    customer: dict[str, Any] = field(init=False)
+    requests: int = 0
+    random: random.Random = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Generate the account."""
+        self.customer = make_customer_response(self.config.panel_count)
+        self.random = random.Random(self.config.seed)  # noqa: S311
+
+    def panel(self, panel_id: int) -> dict[str, Any] | None:
+        """Return the panel with the given id."""
+        return next(
+            (
+                panel
+                for panel in self.customer["customer"]["panels"]
+                if panel["id"] == panel_id
+            ),
+            None,
+        )
+
+
+_STATE = web.AppKey("state", StubState)
+
+
+async def _simulate(request: web.Request) -> StubState:
+    """Apply the configured latency and failure rate to a request."""
+    state = request.app[_STATE]
+    state.requests += 1
+    if state.config.latency:
+        await asyncio.sleep(state.config.latency)
+    if state.random.random() < state.config.failure_rate:
+        raise web.HTTPServiceUnavailable
+    return state
+
+
+async def _token(request: web.Request) -> web.Response:
+    state = await _simulate(request)
+    body = await request.json()
+    return web.json_response(
+        {
+            "token": f"token-{body.get('username')}",
+            "deviceHash": f"hash-{body.get('deviceId')}",
+            "uid": "00000000-0000-0000-0000-000000000000",
+            "confirmed": True,
+            "sendSMS": False,
+            "phoneConfirmed": True,
+            "requests": state.requests,
+        }
+    )
+
+
+async def _customer(request: web.Request) -> web.Response:
+    state = await _simulate(request)
+    if state.config.vary:
+        for panel in state.customer["customer"]["panels"]:
+            panel["updatedDate"] = f"2024-12-01T12:00:00.{state.requests:06d}"
+    return web.json_response(state.customer)
+
+
+async def _set_scene(request: web.Request) -> web.Response:
+    state = await _simulate(request)
+    legacy = (await request.json())["LegacyRequest"]
+    panel = state.panel(int(legacy["id"]))
+    if panel is None:
+        raise web.HTTPNotFound
+    panel["scene"] = panel["activeScene"] = legacy["mode"]
+    # The client sends field names rather than aliases, accept either.
+    panel["waterOn"] = not legacy.get("waterOff", legacy.get("water_off", False))
+    return web.json_response(panel)
+
+
+def create_app(config: StubConfig) -> web.Application:
+    """Create the stub application."""
+    app = web.Application()
+    app[_STATE] = StubState(config)
+    app.router.add_post(f"{API_PATH}/Account/Token", _token)
+    app.router.add_get(f"{API_PATH}/Customer/GetV3", _customer)
+    app.router.add_post(f"{API_PATH}/Command/SetScene", _set_scene)
+    return app
+
+
+async def start_stub_server(
+    config: StubConfig, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Start the stub server and return its runner and API base URL."""
+    runner = web.AppRunner(create_app(config))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}{API_PATH}"
+
+
+def main() -> None:
+    """Serve the stub until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--panels", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--vary", action="store_true")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    config = StubConfig(
+        panel_count=args.panels,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        vary=args.vary,
+    )
+    web.run_app(create_app(config), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
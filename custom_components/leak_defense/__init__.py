@@ -2,30 +2,129 @@
 
 from __future__ import annotations
 
+import dataclasses
+from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
-import voluptuous as vol
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
-from custom_components.leak_defense.models import SceneEnum
-
-from .api import LeakDefenseApiClient
-from .const import DOMAIN
-from .coordinator import BlueprintDataUpdateCoordinator
-from .data import LeakDefenseData
+from .api import LeakDefenseApiClient, create_session
+from .const import (
+    ACTIVE_UPDATE_INTERVAL,
+    COMMAND_RATE_LIMIT_BURST,
+    COMMAND_RATE_LIMIT_PER_SECOND,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_ATTEMPTS,
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    REQUEST_TIMEOUT,
+)
+from .coordinator import BlueprintDataUpdateCoordinator, snapshot_store
+from .data import LeakDefenseData, LeakDefenseDomainData
+from .resilience import TokenBucket
+from .services import async_index_entry_devices, async_setup_services
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import LeakDefenseConfigEntry
 
 
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Register the services once for all config entries."""
+    async_setup_services(hass)
+    return True
+
+
+def _async_get_domain_data(hass: HomeAssistant) -> LeakDefenseDomainData:
+    """Return the data shared by all entries, creating it on first use."""
+    if DOMAIN not in hass.data:
+        domain_data = hass.data[DOMAIN] = LeakDefenseDomainData(
+            session=create_session(),
+            rate_limiter=TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST),
+            command_rate_limiter=TokenBucket(
+                COMMAND_RATE_LIMIT_PER_SECOND, COMMAND_RATE_LIMIT_BURST
+            ),
+        )
+
+        # Entries are not unloaded when Home Assistant stops, close the
+        # session then too.
+        async def _async_close_session(_event: Event) -> None:
+            domain_data.remove_close_listener = None
+            await domain_data.session.close()
+
+        domain_data.remove_close_listener = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    return hass.data[DOMAIN]
+
+
+async def _async_release_domain_data(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop an entry's claim on the shared data, closing it with the last entry."""
+    domain_data: LeakDefenseDomainData | None = hass.data.get(DOMAIN)
+    if domain_data is None:
+        return
+    domain_data.entry_ids.discard(entry_id)
+    if domain_data.coordinators.pop(entry_id, None) is not None:
+        _async_spread_polls(domain_data)
+    domain_data.panel_devices = {
+        device_id: target
+        for device_id, target in domain_data.panel_devices.items()
+        if target[0] != entry_id
+    }
+    if not domain_data.entry_ids:
+        hass.data.pop(DOMAIN)
+        if domain_data.remove_close_listener is not None:
+            domain_data.remove_close_listener()
+        await domain_data.session.close()
+
+
+@callback
+def _async_spread_polls(domain_data: LeakDefenseDomainData) -> None:
+    """
+    Give each entry its own slot of the poll interval.
+
+    Several accounts then spread their requests instead of polling in lockstep.
+    """
+    count = len(domain_data.coordinators)
+    for slot, coordinator in enumerate(domain_data.coordinators.values()):
+        coordinator.poll_phase = slot / count if count > 1 else None
+
+
+@callback
+def _async_remove_panel_devices(
+    hass: HomeAssistant, entry: LeakDefenseConfigEntry
+) -> None:
+    """Detach the devices of panels that left the account from the entry."""
+    removed_panel_ids = entry.runtime_data.coordinator.removed_panel_ids
+    if not removed_panel_ids:
+        return
+    device_registry = dr.async_get(hass)
+    for panel_id in removed_panel_ids:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, str(panel_id))})
+        if device is not None:
+            # The registry deletes the device, and its entities, once no
+            # config entry uses it anymore.
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -33,6 +132,10 @@ async def async_setup_entry(
     entry: LeakDefenseConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    domain_data = _async_get_domain_data(hass)
+    domain_data.entry_ids.add(entry.entry_id)
+    entry.async_on_unload(partial(_async_release_domain_data, hass, entry.entry_id))
+
     coordinator = BlueprintDataUpdateCoordinator(
         hass=hass,
     )
@@ -40,62 +143,42 @@ async def async_setup_entry(
         client=LeakDefenseApiClient(
             token=entry.data["token"],
             device_hash=entry.data["device_hash"],
-            session=async_get_clientsession(hass),
+            session=domain_data.session,
+            rate_limiter=domain_data.rate_limiter,
+            command_rate_limiter=domain_data.command_rate_limiter,
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        entry_data=dict(entry.data),
     )
-
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    async def async_set_scene(call: ServiceCall) -> None:
-        """Handle setting scene."""
-        device_id = call.data["device_id"]
-        scene = call.data["scene"]
-
-        device_registry = dr.async_get(hass)
-        device = device_registry.async_get(device_id)
-
-        if not device:
-            msg = f"Device {device_id} not found"
-            raise ValueError(msg)
-
-        # Get the panel_id from the device identifier
-        panel_id = next(
-            (id_ for domain, id_ in device.identifiers if domain == DOMAIN),
-            None,
+    _async_apply_options(entry)
+
+    # Start from the persisted snapshot when there is one and refresh it in the
+    # background, so a slow cloud does not hold up startup.
+    if await coordinator.async_restore():
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} {entry.entry_id} refresh",
         )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
 
-        if not panel_id:
-            msg = f"No panel ID found for device {device_id}"
-            raise ValueError(msg)
-
-        # Send the scene command
-        await entry.runtime_data.client.async_send_scene(
-            scene=scene,
-            panel_id=int(panel_id),
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_index_entry_devices(hass, entry)
+    # Panels shared with or removed from the account are picked up by the
+    # platforms and here, without reloading the entry.
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            partial(_async_remove_panel_devices, hass, entry)
         )
-        await entry.runtime_data.coordinator.async_request_refresh()
-
-    # Register the service with schema validation
-    service_schema = vol.Schema(
-        {
-            vol.Required("device_id"): str,
-            vol.Required("scene"): vol.In([scene.value for scene in SceneEnum]),
-        }
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        "set_scene",
-        async_set_scene,
-        schema=service_schema,
-    )
+    domain_data.coordinators[entry.entry_id] = coordinator
+    _async_spread_polls(domain_data)
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_entry))
 
     return True
 
@@ -105,13 +188,51 @@ async def async_unload_entry(
     entry: LeakDefenseConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # Write the snapshot before the delayed save outlives the entry, and
+        # before async_remove_entry deletes it when the entry is removed.
+        await entry.runtime_data.coordinator.async_save_snapshot()
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: LeakDefenseConfigEntry,
+) -> None:
+    """Remove the persisted snapshot of a deleted entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+
+
+@callback
+def _async_apply_options(entry: LeakDefenseConfigEntry) -> None:
+    """Apply the entry options to the running client and coordinator."""
+    options = entry.options
+    entry.runtime_data.coordinator.set_update_interval_bounds(
+        timedelta(
+            seconds=options.get(
+                CONF_MIN_UPDATE_INTERVAL, ACTIVE_UPDATE_INTERVAL.total_seconds()
+            )
+        ),
+        timedelta(
+            seconds=options.get(
+                CONF_MAX_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL.total_seconds()
+            )
+        ),
+    )
+    client = entry.runtime_data.client
+    client.request_timeout = options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT)
+    client.retry_policy = dataclasses.replace(
+        client.retry_policy,
+        attempts=int(options.get(CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS)),
+    )
 
 
-async def async_reload_entry(
+async def async_update_entry(
     hass: HomeAssistant,
     entry: LeakDefenseConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Apply changed options live, reloading only when the entry data changed."""
+    if entry.data != entry.runtime_data.entry_data:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    _async_apply_options(entry)
@@ -2,25 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import logging
 import socket
+import time
 import uuid
-from typing import Any
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
 import async_timeout
-
+from aiohttp import hdrs
+from pydantic import ValidationError
+
+from .const import (
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_POOL_SIZE,
+    DEFAULT_MAX_SNAPSHOT_AGE,
+    DNS_CACHE_TTL,
+    REQUEST_TIMEOUT,
+    SCENE_COMMAND_DEBOUNCE,
+)
+from .metrics import EndpointStats
 from .models import (
+    PANEL_STATE_ADAPTER,
     CommandSetScene,
     Customer,
+    CustomerResponse,
+    CustomerState,
+    CustomerStateResponse,
     HexRequest,
     LegacyRequest,
+    PanelState,
     SceneEnum,
     TokenResponse,
 )
+from .resilience import BreakerState, CircuitBreaker, RetryPolicy, TokenBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+    from datetime import timedelta
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass
+class _PendingScene:
+    """A scene command waiting in a panel's queue."""
+
+    scene: SceneEnum
+    snapshot: PanelState | None
+    snapshot_age: timedelta | None
+    # Sends the command once the debounce window passed.
+    task: asyncio.Task[PanelState | None] = field(init=False)
+
 
 class LeakDefenseApiClientError(Exception):
     """Exception to indicate a general API error."""
@@ -38,6 +78,61 @@ class LeakDefenseApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+@dataclass
+class ApiClientStats:
+    """Counters describing how the client's requests went."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    retry_seconds: float = 0.0
+    breaker_rejections: int = 0
+    breaker_states: dict[str, BreakerState] = field(default_factory=dict)
+    last_parse_seconds: float | None = None
+    parse_seconds: float = 0.0
+    parses: int = 0
+    superseded_scenes: int = 0
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+
+    def record_request(
+        self, endpoint: str, seconds: float, response_bytes: int | None
+    ) -> None:
+        """Record a completed request attempt to an endpoint."""
+        if (stats := self.endpoints.get(endpoint)) is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.record(seconds, response_bytes)
+
+    def record_parse(self, seconds: float) -> None:
+        """Record the time spent validating a response body."""
+        self.last_parse_seconds = seconds
+        self.parse_seconds += seconds
+        self.parses += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a JSON friendly form."""
+        return {
+            **asdict(self),
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()
+            },
+        }
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connection pool tuned for polling the API."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_POOL_SIZE,
+        limit_per_host=CONNECTION_POOL_SIZE,
+        keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={hdrs.ACCEPT_ENCODING: "gzip, deflate"},
+    )
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -46,18 +141,35 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+def _is_retryable(exception: LeakDefenseApiClientCommunicationError) -> bool:
+    """Return True if the failure is transient and worth retrying."""
+    cause = exception.__cause__
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return (
+            cause.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+            or cause.status == HTTPStatus.TOO_MANY_REQUESTS
+        )
+    return True
+
+
 class LeakDefenseApiClient:
     """Leak Defense API Client."""
 
     _base_url: str = "https://www.catchaleak.com/mobile-hex-api/api"
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         session: aiohttp.ClientSession,
         token: str | None = None,
         device_hash: str | None = None,
         username: str | None = None,
         password: str | None = None,
+        max_snapshot_age: timedelta = DEFAULT_MAX_SNAPSHOT_AGE,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        command_rate_limiter: TokenBucket | None = None,
+        scene_debounce: float = SCENE_COMMAND_DEBOUNCE,
+        request_timeout: float = REQUEST_TIMEOUT,
     ) -> None:
         """
         Initialize the API Client.
@@ -68,6 +180,16 @@ class LeakDefenseApiClient:
             device_hash: An optional device ID for authentication.
             username: Optional username for generating credentials.
             password: Optional password for generating credentials.
+            max_snapshot_age: How old a cached panel snapshot may be before
+                a scene command reads the panel from the API again.
+            retry_policy: Retry policy for idempotent GET requests.
+            rate_limiter: Optional rate limiter of reads, shared with other
+                clients.
+            command_rate_limiter: Optional rate limiter of commands, shared
+                with other clients.
+            scene_debounce: Seconds a scene command waits for a newer scene
+                for the same panel before it is sent.
+            request_timeout: Timeout in seconds of a single request attempt.
 
         """
         self._session = session
@@ -76,6 +198,37 @@ class LeakDefenseApiClient:
         self._username = username
         self._password = password
         self._device_id = str(uuid.uuid4())
+        self.max_snapshot_age = max_snapshot_age
+        # Last parsed customer with the body digest and cache validators it came
+        # from, used to short-circuit polls that return an unchanged payload.
+        self._customer: CustomerState | None = None
+        self._customer_digest: bytes | None = None
+        self._customer_validators: dict[str, str] = {}
+        # Monotonic time the last successful GetV3 poll completed.
+        self._customer_fetched_at: float | None = None
+        # In-flight idempotent reads, shared by every caller that asks for the
+        # same resource while the request is still running.
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.request_timeout = request_timeout
+        # One breaker per endpoint, so failing commands do not stop polling.
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._rate_limiter = rate_limiter
+        self._command_rate_limiter = command_rate_limiter
+        self._stats = ApiClientStats()
+        # Per panel: the scene command that has not been sent yet, and a lock
+        # that lets a single command per panel be in flight.
+        self.scene_debounce = scene_debounce
+        self._pending_scenes: dict[int, _PendingScene] = {}
+        self._scene_locks: dict[int, asyncio.Lock] = {}
+
+    @property
+    def stats(self) -> ApiClientStats:
+        """Return request, retry and circuit breaker statistics."""
+        self._stats.breaker_states = {
+            endpoint: breaker.state for endpoint, breaker in self._breakers.items()
+        }
+        return self._stats
 
     async def async_register_application(self) -> TokenResponse:
         """Register device with the API."""
@@ -106,8 +259,77 @@ class LeakDefenseApiClient:
 
         return TokenResponse(**response)
 
-    async def async_get_data(self) -> Customer:
-        """Get data from the API."""
+    async def async_get_data(self) -> CustomerState:
+        """
+        Get the panel snapshots from the API.
+
+        Overlapping calls share a single request and receive the same result.
+        When the server answers 304 Not Modified, or sends a body identical to
+        the previous one, the previously returned object is returned again
+        without parsing, so callers can detect "no change" by identity.
+        """
+        if not self._token or not self._device_id:
+            msg = "Token and device ID must be provided."
+            raise LeakDefenseApiClientAuthenticationError(msg)
+
+        return await self._async_coalesce("/Customer/GetV3", self._async_fetch_customer)
+
+    async def _async_fetch_customer(self) -> CustomerState:
+        """Fetch and parse the customer, reusing the previous one if unchanged."""
+        headers = {
+            "deviceid": self._device_hash,
+            "token": self._token,
+        }
+        if self._customer is not None:
+            headers.update(self._customer_validators)
+
+        response = await self._api_wrapper(
+            method="get",
+            endpoint="/Customer/GetV3",
+            headers=headers,
+            raw=True,
+        )
+        if response.status == HTTPStatus.NOT_MODIFIED and self._customer is not None:
+            self._customer_fetched_at = time.monotonic()
+            return self._customer
+
+        body = await response.read()
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == self._customer_digest and self._customer is not None:
+            self._customer_fetched_at = time.monotonic()
+            return self._customer
+
+        # Validate the raw body in a single pass instead of decoding it to
+        # Python objects first and walking them again through the models, and
+        # only into the fields the integration reads.
+        start = time.perf_counter()
+        try:
+            customer = CustomerStateResponse.model_validate_json(body).customer
+        except ValidationError as exception:
+            msg = f"Invalid customer data received - {exception}"
+            raise LeakDefenseApiClientError(msg) from exception
+        finally:
+            self._stats.record_parse(time.perf_counter() - start)
+
+        self._customer = customer
+        self._customer_digest = digest
+        self._customer_fetched_at = time.monotonic()
+        self._customer_validators = {
+            request_header: response.headers[response_header]
+            for response_header, request_header in (
+                (hdrs.ETAG, hdrs.IF_NONE_MATCH),
+                (hdrs.LAST_MODIFIED, hdrs.IF_MODIFIED_SINCE),
+            )
+            if response_header in response.headers
+        }
+        return customer
+
+    async def async_get_full_customer(self) -> Customer:
+        """
+        Get the complete customer model from the API, for diagnostics.
+
+        Polls keep only the panel snapshots, so the account is read again.
+        """
         if not self._token or not self._device_id:
             msg = "Token and device ID must be provided."
             raise LeakDefenseApiClientAuthenticationError(msg)
@@ -119,25 +341,129 @@ class LeakDefenseApiClient:
                 "deviceid": self._device_hash,
                 "token": self._token,
             },
+            raw=True,
         )
-        return Customer(**response.get("customer"))
+        try:
+            return CustomerResponse.model_validate_json(await response.read()).customer
+        except ValidationError as exception:
+            msg = f"Invalid customer data received - {exception}"
+            raise LeakDefenseApiClientError(msg) from exception
+
+    async def async_send_scene(
+        self,
+        scene: SceneEnum,
+        panel_id: int,
+        snapshot: PanelState | None = None,
+        snapshot_age: timedelta | None = None,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> PanelState | None:
+        """
+        Queue a scene for a panel and return the panel once it was sent.
+
+        A scene still waiting out its debounce window is replaced by a newer one
+        for the same panel, and both callers get the result of the newer scene.
+        ``limiter`` bounds the commands sent at once, see ``_async_send_scene``
+        for the other arguments and the result.
+        """
+        if (pending := self._pending_scenes.get(panel_id)) is not None:
+            pending.scene = scene
+            if snapshot is not None:
+                pending.snapshot = snapshot
+                pending.snapshot_age = snapshot_age
+            self._stats.superseded_scenes += 1
+        else:
+            pending = _PendingScene(
+                scene=scene, snapshot=snapshot, snapshot_age=snapshot_age
+            )
+            # The command runs in its own task, so a caller that is cancelled
+            # does not cancel a newer scene other callers are waiting for.
+            pending.task = asyncio.create_task(
+                self._async_send_pending_scene(panel_id, pending, limiter)
+            )
+            # Retrieve the exception so it is not reported as never retrieved
+            # when every caller has been cancelled.
+            pending.task.add_done_callback(
+                lambda done: done.cancelled() or done.exception()
+            )
+            self._pending_scenes[panel_id] = pending
+        return await asyncio.shield(pending.task)
+
+    async def _async_send_pending_scene(
+        self,
+        panel_id: int,
+        pending: _PendingScene,
+        limiter: asyncio.Semaphore | None,
+    ) -> PanelState | None:
+        """Send a queued scene after the debounce window, one at a time per panel."""
+        try:
+            await asyncio.sleep(self.scene_debounce)
+            lock = self._scene_locks.setdefault(panel_id, asyncio.Lock())
+            async with lock, limiter or contextlib.nullcontext():
+                # From here on a new scene for the panel starts the next command.
+                self._pending_scenes.pop(panel_id, None)
+                return await self._async_send_scene(
+                    pending.scene, panel_id, pending.snapshot, pending.snapshot_age
+                )
+        finally:
+            if self._pending_scenes.get(panel_id) is pending:
+                del self._pending_scenes[panel_id]
+
+    async def _async_send_scene(
+        self,
+        scene: SceneEnum,
+        panel_id: int,
+        snapshot: PanelState | None = None,
+        snapshot_age: timedelta | None = None,
+    ) -> PanelState | None:
+        """
+        Send a scene to the API.
 
-    async def async_send_scene(self, scene: SceneEnum, panel_id: int) -> None:
-        """Send a scene to the API."""
+        The command carries the panel's current countdown timer, trip value and
+        valve state. They are taken from ``snapshot`` when it is given and no
+        older than ``max_snapshot_age``, or from the client's last poll when that
+        is more recent. The panel is read from the API otherwise, and whenever
+        the cached panel is in alarm: the alarm may have closed the valve since,
+        and a stale valve state would open it again.
+
+        Returns the updated panel parsed from the panel view model the API sends
+        back, or None if the response did not contain a usable panel.
+        """
         if not self._token or not self._device_id:
             msg = "Token and device ID must be provided."
             raise LeakDefenseApiClientAuthenticationError(msg)
 
         _LOGGER.info("Sending scene to the API.")
 
-        customer = await self.async_get_data()
+        current_panel: PanelState | None = None
+        if (
+            snapshot is not None
+            and snapshot.id == panel_id
+            and snapshot_age is not None
+            and snapshot_age <= self.max_snapshot_age
+        ):
+            current_panel = snapshot
+            # A poll completed after the snapshot was taken is more recent.
+            if (
+                self._customer is not None
+                and self._customer_fetched_at is not None
+                and time.monotonic() - self._customer_fetched_at
+                < snapshot_age.total_seconds()
+            ):
+                current_panel = next(
+                    (panel for panel in self._customer.panels if panel.id == panel_id),
+                    snapshot,
+                )
+            if current_panel.in_alarm:
+                current_panel = None
 
-        # Get the panel with the specified ID
+        if current_panel is None:
+            customer = await self.async_get_data()
 
-        current_panel = next(
-            (panel for panel in customer.panels if panel.id == panel_id),
-            None,
-        )
+            # Get the panel with the specified ID
+            current_panel = next(
+                (panel for panel in customer.panels if panel.id == panel_id),
+                None,
+            )
 
         if not current_panel:
             msg = f"Panel with ID {panel_id} not found."
@@ -164,7 +490,7 @@ class LeakDefenseApiClient:
             payload_dict = scene_payload.dict()
 
         _LOGGER.debug("Scene payload: %s", payload_dict)
-        await self._api_wrapper(
+        response = await self._api_wrapper(
             method="post",
             endpoint="/Command/SetScene",
             headers={
@@ -172,8 +498,33 @@ class LeakDefenseApiClient:
                 "token": self._token,
             },
             data=scene_payload.model_dump(),
+            raw=True,
         )
 
+        try:
+            return PANEL_STATE_ADAPTER.validate_json(await response.read())
+        except ValidationError as exception:
+            _LOGGER.debug("Unable to parse returned panel view model: %s", exception)
+            return None
+
+    async def _async_coalesce(
+        self, key: str, request: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> _T:
+        """
+        Run ``request`` once for all overlapping callers using the same key.
+
+        Waiters are shielded from each other, so a cancelled caller does not
+        cancel the request the others are still waiting on.
+        """
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(request())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Retrieve the exception so it is not reported as never retrieved
+            # when every waiter has been cancelled.
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return await asyncio.shield(future)
+
     def _make_headers(self, additional_headers: dict) -> dict:
         return {
             "user-agent": "LeakDefense/6 CFNetwork/1568.200.51 Darwin/24.1.0",
@@ -186,10 +537,82 @@ class LeakDefenseApiClient:
         endpoint: str,
         headers: dict | None = None,
         data: dict | None = None,
+        *,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Make a request to the API.
+
+        Idempotent GET requests are retried on transient failures with jittered
+        exponential backoff. They take a token from the read rate limiter, other
+        requests from the command rate limiter. Requests to an endpoint are
+        rejected without being sent while its circuit breaker is open. Only
+        transient failures count towards opening it; a rejected request does
+        not.
+
+        Returns the decoded JSON body. When ``raw`` is set the response itself is
+        returned with its body already read, so the caller can inspect the
+        status and headers and validate the body bytes directly.
+        """
+        if method == "get":
+            attempts = max(1, self.retry_policy.attempts)
+            rate_limiter = self._rate_limiter
+        else:
+            attempts = 1
+            rate_limiter = self._command_rate_limiter
+        attempt = 0
+        if (breaker := self._breakers.get(endpoint)) is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker()
+        while True:
+            if not breaker.allow_request():
+                self._stats.breaker_rejections += 1
+                msg = f"Circuit breaker open, not calling {endpoint}"
+                raise LeakDefenseApiClientCommunicationError(msg)
+
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            self._stats.requests += 1
+            try:
+                result = await self._api_request(
+                    method, endpoint, headers, data, raw=raw
+                )
+            except LeakDefenseApiClientCommunicationError as exception:
+                self._stats.failures += 1
+                attempt += 1
+                if not _is_retryable(exception):
+                    breaker.release()
+                    raise
+                breaker.record_failure()
+                if attempt >= attempts:
+                    raise
+                delay = self.retry_policy.backoff(attempt - 1)
+                _LOGGER.debug("Retrying %s in %.2fs: %s", endpoint, delay, exception)
+                self._stats.retries += 1
+                self._stats.retry_seconds += delay
+                await asyncio.sleep(delay)
+            except BaseException:
+                # Authentication and unexpected errors and cancellations must
+                # not leave a half-open breaker waiting for the probe forever.
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+    async def _api_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict | None,
+        data: dict | None,
+        *,
+        raw: bool,
     ) -> Any:
-        """Make a request to the API."""
+        """Make a single request attempt."""
+        start = time.perf_counter()
+        response_bytes = None
         try:
-            async with async_timeout.timeout(10):
+            async with async_timeout.timeout(self.request_timeout):
                 response = await self._session.request(
                     method=method,
                     url=self._base_url + endpoint,
@@ -197,8 +620,14 @@ class LeakDefenseApiClient:
                     json=data,
                 )
                 _verify_response_or_raise(response)
+                # The body is cached on the response, json() decodes it from there.
+                response_bytes = len(await response.read())
+                if raw:
+                    return response
                 return await response.json()
 
+        except LeakDefenseApiClientError:
+            raise
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
             raise LeakDefenseApiClientCommunicationError(msg) from exception
@@ -208,3 +637,7 @@ class LeakDefenseApiClient:
         except Exception as exception:
             msg = f"Something really wrong happened! - {exception}"
             raise LeakDefenseApiClientError(msg) from exception
+        finally:
+            self._stats.record_request(
+                endpoint, time.perf_counter() - start, response_bytes
+            )
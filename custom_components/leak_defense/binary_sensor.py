@@ -9,8 +9,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 
-from custom_components.leak_defense.entity import LeakDefenseEntity
+from custom_components.leak_defense.entity import (
+    LeakDefenseEntity,
+    LeakDefensePoldEntity,
+    async_setup_panel_entities,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,7 +24,7 @@ if TYPE_CHECKING:
 
     from .coordinator import BlueprintDataUpdateCoordinator
     from .data import LeakDefenseConfigEntry
-    from .models import Panel
+    from .models import PanelState, Pold
 
 ENTITY_DESCRIPTIONS = (
     BinarySensorEntityDescription(
@@ -32,14 +38,34 @@ ENTITY_DESCRIPTIONS = (
 class WaterValveEntity(LeakDefenseEntity, BinarySensorEntity):
     """Entity for a water valve device."""
 
+    # The flow changes with almost every poll; keep it out of the recorder's
+    # attribute rows.
+    _unrecorded_attributes = frozenset({"flow_value"})
+    _panel_fields = frozenset(
+        {
+            "water_on",
+            "offline",
+            "too_cold",
+            "scene",
+            "flow_value",
+            "trip_value",
+            "in_alarm",
+        }
+    )
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the water valve entity."""
         super().__init__(coordinator, panel=inital_panel)
-        self.panel: Panel = inital_panel
+        self.panel: PanelState = inital_panel
         self._attr_name: str = f"{inital_panel.text_identifier} Water Valve"
         self._attr_unique_id: str = f"leak_defense_{inital_panel.id}"
+        # Attributes and the coordinator data and stale flag they were built
+        # from.
+        self._attributes: dict[str, Any] = {}
+        self._attributes_data: object = None
+        self._attributes_stale: bool | None = None
 
     @property
     def is_on(self) -> bool:
@@ -50,22 +76,38 @@ class WaterValveEntity(LeakDefenseEntity, BinarySensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes for the water valve."""
-        return {
-            "offline": self.panel.offline,
-            "too_cold": self.panel.too_cold,
-            "scene": self.panel.scene,
-            "flow_value": self.panel.flow_value,
-            "trip_value": self.panel.trip_value,
-            "in_alarm": self.panel.in_alarm,
-        }
+        """
+        Return additional attributes for the water valve.
+
+        They are built from the current panel once per coordinator data
+        object and reused for every state write until the data changes.
+        """
+        data = self.coordinator.data
+        stale = self.coordinator.stale
+        if data is not self._attributes_data or stale != self._attributes_stale:
+            attributes = dict(super().extra_state_attributes or {})
+            if panel := data["panels"].get(self.panel.id):
+                attributes.update(
+                    offline=panel.offline,
+                    too_cold=panel.too_cold,
+                    scene=panel.scene,
+                    flow_value=panel.flow_value,
+                    trip_value=panel.trip_value,
+                    in_alarm=panel.in_alarm,
+                )
+            self._attributes = attributes
+            self._attributes_data = data
+            self._attributes_stale = stale
+        return self._attributes
 
 
 class PanelTooColdEntity(LeakDefenseEntity, BinarySensorEntity):
     """Binary sensor for panel too cold status."""
 
+    _panel_fields = frozenset({"too_cold"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the too cold binary sensor."""
         super().__init__(coordinator, panel=inital_panel)
@@ -84,8 +126,10 @@ class PanelTooColdEntity(LeakDefenseEntity, BinarySensorEntity):
 class PanelOfflineEntity(LeakDefenseEntity, BinarySensorEntity):
     """Binary sensor for panel offline status."""
 
+    _panel_fields = frozenset({"offline"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the offline binary sensor."""
         super().__init__(coordinator, panel=inital_panel)
@@ -104,8 +148,10 @@ class PanelOfflineEntity(LeakDefenseEntity, BinarySensorEntity):
 class PanelInAlarmEntity(LeakDefenseEntity, BinarySensorEntity):
     """Binary sensor for panel in alarm status."""
 
+    _panel_fields = frozenset({"in_alarm"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the in alarm binary sensor."""
         super().__init__(coordinator, panel=inital_panel)
@@ -121,24 +167,102 @@ class PanelInAlarmEntity(LeakDefenseEntity, BinarySensorEntity):
         return updated_panel.in_alarm if updated_panel else False
 
 
+class PanelSuspectedLeakEntity(LeakDefenseEntity, BinarySensorEntity):
+    """Binary sensor for a leak suspected by the local flow detection."""
+
+    _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _panel_fields = frozenset({"flow_value", "trip_value", "countdown_timer"})
+
+    def __init__(
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
+    ) -> None:
+        """Initialize the suspected leak binary sensor."""
+        super().__init__(coordinator, panel=inital_panel)
+        self.panel = inital_panel
+        self._attr_name = f"{inital_panel.text_identifier} Suspected Leak"
+        self._attr_unique_id = f"leak_defense_{inital_panel.id}_suspected_leak"
+        self._written_is_on: bool | None = None
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if sustained flow above the trip value suggests a leak."""
+        return self.coordinator.leak_suspected(self.panel.id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when the suspicion changed, even if no field did."""
+        is_on = self.is_on
+        if is_on != self._written_is_on:
+            self._written_is_on = is_on
+            self._written_available = self.available
+            self._written_stale = self.coordinator.stale
+            self.async_write_ha_state()
+            return
+        super()._handle_coordinator_update()
+
+
+class PoldMoistureEntity(LeakDefensePoldEntity, BinarySensorEntity):
+    """Binary sensor for a remote leak sensor detecting water."""
+
+    _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _panel_fields = frozenset({"pold_alarm_id"})
+    _key = "moisture"
+    _label = "Moisture"
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the POLD reports water or raised the panel's alarm."""
+        pold = self.pold
+        if pold is None:
+            return False
+        panel = self.coordinator.data["panels"].get(self.panel.id)
+        return pold.in_alarm or (panel is not None and panel.pold_alarm_id == pold.id)
+
+
+class PoldBatteryEntity(LeakDefensePoldEntity, BinarySensorEntity):
+    """Binary sensor for a remote leak sensor's low battery."""
+
+    _attr_device_class = BinarySensorDeviceClass.BATTERY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key = "battery"
+    _label = "Battery"
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the POLD's battery is low."""
+        pold = self.pold
+        return pold.battery_low if pold else False
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001
     entry: LeakDefenseConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the water valve entities."""
-    coordinator: BlueprintDataUpdateCoordinator = entry.runtime_data.coordinator
+    async_setup_panel_entities(
+        entry, async_add_entities, _panel_entities, _pold_entities
+    )
 
-    # Ensure initial data fetch
-    await coordinator.async_config_entry_first_refresh()
 
-    # Create entities for each panel
-    entities: list[BinarySensorEntity] = []
+def _panel_entities(
+    coordinator: BlueprintDataUpdateCoordinator, panel: PanelState
+) -> list[BinarySensorEntity]:
+    """Create the binary sensors of a panel."""
+    return [
+        WaterValveEntity(coordinator, panel),
+        PanelTooColdEntity(coordinator, panel),
+        PanelOfflineEntity(coordinator, panel),
+        PanelInAlarmEntity(coordinator, panel),
+        PanelSuspectedLeakEntity(coordinator, panel),
+    ]
 
-    for panel in coordinator.data["panels"].values():
-        entities.append(WaterValveEntity(coordinator, panel))
-        entities.append(PanelTooColdEntity(coordinator, panel))
-        entities.append(PanelOfflineEntity(coordinator, panel))
-        entities.append(PanelInAlarmEntity(coordinator, panel))
 
-    async_add_entities(entities)
+def _pold_entities(
+    coordinator: BlueprintDataUpdateCoordinator, panel: PanelState, pold: Pold
+) -> list[BinarySensorEntity]:
+    """Create the binary sensors of a POLD."""
+    return [
+        PoldMoistureEntity(coordinator, panel, pold),
+        PoldBatteryEntity(coordinator, panel, pold),
+    ]
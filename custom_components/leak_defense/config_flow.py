@@ -5,6 +5,7 @@ from __future__ import annotations
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
@@ -14,7 +15,35 @@ from .api import (
     LeakDefenseApiClientCommunicationError,
     LeakDefenseApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    ACTIVE_UPDATE_INTERVAL,
+    CONF_AUTO_SHUTOFF,
+    CONF_COMMAND_CONCURRENCY,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_RETRY_ATTEMPTS,
+    DEFAULT_AUTO_SHUTOFF,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_RETRY_ATTEMPTS,
+    DOMAIN,
+    LOGGER,
+    MAX_UPDATE_INTERVAL,
+    REQUEST_TIMEOUT,
+)
+
+
+def _seconds_selector(minimum: int, maximum: int) -> selector.NumberSelector:
+    """Return a number selector for a duration in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        )
+    )
 
 
 class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -22,6 +51,14 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LeakDefenseOptionsFlow:
+        """Return the options flow."""
+        return LeakDefenseOptionsFlow(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -78,3 +115,83 @@ class BlueprintFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=_errors,
         )
+
+
+class LeakDefenseOptionsFlow(config_entries.OptionsFlow):
+    """
+    Options flow for Leak Defense.
+
+    The options are applied to the running client and coordinator when they
+    are saved, without reloading the entry.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> data_entry_flow.FlowResult:
+        """Manage the options."""
+        _errors = {}
+        if user_input is not None:
+            if (
+                user_input[CONF_MIN_UPDATE_INTERVAL]
+                > user_input[CONF_MAX_UPDATE_INTERVAL]
+            ):
+                _errors["base"] = "interval_bounds"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = {**self.config_entry.options, **(user_input or {})}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_UPDATE_INTERVAL,
+                            ACTIVE_UPDATE_INTERVAL.total_seconds(),
+                        ),
+                    ): _seconds_selector(5, 3600),
+                    vol.Required(
+                        CONF_MAX_UPDATE_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_UPDATE_INTERVAL,
+                            MAX_UPDATE_INTERVAL.total_seconds(),
+                        ),
+                    ): _seconds_selector(5, 3600),
+                    vol.Required(
+                        CONF_REQUEST_TIMEOUT,
+                        default=options.get(CONF_REQUEST_TIMEOUT, REQUEST_TIMEOUT),
+                    ): _seconds_selector(1, 60),
+                    vol.Required(
+                        CONF_RETRY_ATTEMPTS,
+                        default=options.get(
+                            CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1, max=10, mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Required(
+                        CONF_COMMAND_CONCURRENCY,
+                        default=options.get(
+                            CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1, max=32, mode=selector.NumberSelectorMode.BOX
+                        )
+                    ),
+                    vol.Required(
+                        CONF_AUTO_SHUTOFF,
+                        default=options.get(CONF_AUTO_SHUTOFF, DEFAULT_AUTO_SHUTOFF),
+                    ): selector.BooleanSelector(),
+                }
+            ),
+            errors=_errors,
+        )
@@ -1,8 +1,102 @@
 """Constants for leak_defense."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "leak_defense"
 ATTRIBUTION = "Data provided by http://jsonplaceholder.typicode.com/"
+
+# Adaptive polling: poll fast while water is moving or an alarm is pending,
+# then back off toward the interval advertised by the panels when idle.
+DEFAULT_UPDATE_INTERVAL = timedelta(seconds=30)
+ACTIVE_UPDATE_INTERVAL = timedelta(seconds=10)
+MAX_UPDATE_INTERVAL = timedelta(minutes=5)
+OFFLINE_UPDATE_INTERVAL = timedelta(minutes=5)
+UPDATE_INTERVAL_BACKOFF_FACTOR = 1.5
+
+# Timeout in seconds of a single API request attempt.
+REQUEST_TIMEOUT = 10
+
+# Shared by every config entry: token buckets bounding the request rate of the
+# whole integration and a dedicated, keep-alive connection pool. Commands have
+# their own budget, so polls never hold up a scene a user asked for.
+RATE_LIMIT_PER_SECOND = 1.0
+RATE_LIMIT_BURST = 5
+COMMAND_RATE_LIMIT_PER_SECOND = 4.0
+COMMAND_RATE_LIMIT_BURST = 20
+CONNECTION_POOL_SIZE = 10
+CONNECTION_KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Maximum age of a coordinator snapshot that may stand in for a fresh GetV3 read
+# when building a SetScene command.
+DEFAULT_MAX_SNAPSHOT_AGE = timedelta(seconds=60)
+
+# Seconds a scene command waits for a newer scene for the same panel, which
+# then replaces it, before it is sent.
+SCENE_COMMAND_DEBOUNCE = 0.5
+
+# A requested scene is shown right away and confirmed by polling at this
+# interval until the panel reports it as active, or reverted after the timeout.
+SCENE_CONFIRM_INTERVAL = timedelta(seconds=2)
+SCENE_CONFIRM_TIMEOUT = timedelta(seconds=60)
+EVENT_SCENE_NOT_CONFIRMED = f"{DOMAIN}_scene_not_confirmed"
+
+# The last good snapshot is persisted so entities can be created from it at
+# startup while the first refresh runs in the background.
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+ATTR_STALE = "stale"
+
+# Time window of the rolling flow statistics, and the most samples kept per
+# panel for it (one hour at the fastest configurable poll interval).
+FLOW_HISTORY_WINDOW = timedelta(hours=1)
+FLOW_HISTORY_SIZE = 720
+
+# Flow is integrated into a water volume only across gaps between samples up
+# to this long, or twice the longest poll interval when the options allow longer
+# ones; longer gaps (outages, offline panels) are skipped.
+FLOW_INTEGRATION_MAX_GAP = 900
+
+# Local leak detection: the event fired when sustained flow at or above a
+# panel's trip value outlasts its countdown timer, and the entry option that
+# closes the valve (AWAY scene) when that happens.
+EVENT_SUSPECTED_LEAK = f"{DOMAIN}_suspected_leak"
+CONF_AUTO_SHUTOFF = "auto_shutoff"
+DEFAULT_AUTO_SHUTOFF = False
+
+# Scene commands of one set_scene call run concurrently, at most this many at
+# a time per config entry (entry option).
+CONF_COMMAND_CONCURRENCY = "command_concurrency"
+DEFAULT_COMMAND_CONCURRENCY = 4
+
+# A panel missing from the account is only removed, with its device and
+# entities, once it has been absent from this many consecutive successful polls
+# spanning at least this long. A poll without any panel never counts.
+PANEL_REMOVAL_POLLS = 5
+PANEL_REMOVAL_DELAY = timedelta(hours=1)
+
+# Edges of these panel fields are fired as EVENT_LEAK_DEFENSE on the bus and
+# offered as device triggers: (field, new value) -> trigger type.
+EVENT_LEAK_DEFENSE = f"{DOMAIN}_event"
+TRANSITION_TYPES: dict[tuple[str, bool], str] = {
+    ("in_alarm", True): "alarm_started",
+    ("in_alarm", False): "alarm_cleared",
+    ("offline", True): "went_offline",
+    ("offline", False): "came_online",
+    ("too_cold", True): "too_cold",
+    ("too_cold", False): "too_cold_cleared",
+    ("water_on", True): "water_turned_on",
+    ("water_on", False): "water_turned_off",
+}
+TRANSITION_FIELDS = frozenset(field for field, _ in TRANSITION_TYPES)
+
+# Options applied live to the running client and coordinator. The poll bounds
+# and the request timeout are in seconds.
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_RETRY_ATTEMPTS = "retry_attempts"
+DEFAULT_RETRY_ATTEMPTS = 3
@@ -2,29 +2,93 @@
 
 from __future__ import annotations
 
+import dataclasses
+import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from pydantic import ValidationError
 
 from .api import (
     LeakDefenseApiClientAuthenticationError,
     LeakDefenseApiClientError,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    ACTIVE_UPDATE_INTERVAL,
+    CONF_AUTO_SHUTOFF,
+    DEFAULT_AUTO_SHUTOFF,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    EVENT_LEAK_DEFENSE,
+    EVENT_SCENE_NOT_CONFIRMED,
+    EVENT_SUSPECTED_LEAK,
+    FLOW_INTEGRATION_MAX_GAP,
+    LOGGER,
+    MAX_UPDATE_INTERVAL,
+    OFFLINE_UPDATE_INTERVAL,
+    PANEL_REMOVAL_DELAY,
+    PANEL_REMOVAL_POLLS,
+    SCENE_CONFIRM_INTERVAL,
+    SCENE_CONFIRM_TIMEOUT,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TRANSITION_FIELDS,
+    TRANSITION_TYPES,
+    UPDATE_INTERVAL_BACKOFF_FACTOR,
+)
+from .detector import LeakDetector
+from .history import FlowHistory
+from .models import PANEL_STATE_ADAPTER, PanelState, SceneEnum
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
 
     from .data import LeakDefenseConfigEntry
-    from .models import Panel
+    from .models import CustomerState, Pold
 
 
 class CoordinatorData(TypedDict):
     """Coordinator data."""
 
-    panels: dict[int, Panel]
+    panels: dict[int, PanelState]
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the persisted snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+_PANEL_STATE_FIELDS = frozenset(field.name for field in dataclasses.fields(PanelState))
+
+
+def _changed_fields(old: PanelState | None, new: PanelState | None) -> frozenset[str]:
+    """Return the names of the panel fields that differ between two snapshots."""
+    if old is new:
+        return frozenset()
+    if old is None or new is None:
+        return _PANEL_STATE_FIELDS
+    if old == new:
+        return frozenset()
+    return frozenset(
+        name for name in _PANEL_STATE_FIELDS if getattr(old, name) != getattr(new, name)
+    )
+
+
+def _panel_is_active(panel: PanelState) -> bool:
+    """Return True if the panel reports water moving or an alarm pending."""
+    if panel.offline:
+        return False
+    return panel.flow_value > 0 or panel.in_alarm or panel.time_to_alarm > 0
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -42,11 +106,111 @@ class BlueprintDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            # Unchanged polls hand back the previous data object, which lets the
+            # coordinator skip notifying listeners altogether.
+            always_update=False,
         )
+        self.min_update_interval = ACTIVE_UPDATE_INTERVAL
+        self.max_update_interval = MAX_UPDATE_INTERVAL
+        # The adaptive poll interval, and the fraction of it this entry's polls
+        # are shifted by when several entries spread their polls, see _phased.
+        self._poll_interval = DEFAULT_UPDATE_INTERVAL
+        self.poll_phase: float | None = None
+        self._data_updated_at: float | None = None
+        self._customer: CustomerState | None = None
+        # Fields that changed per panel id in the most recent published update.
+        self.changed_fields: dict[int, frozenset[str]] = {}
+        # True while the data was restored from storage and not yet refreshed.
+        self.stale = False
+        self.last_success_time: datetime | None = None
+        self.last_update_seconds: float | None = None
+        self.flow_history: dict[int, FlowHistory] = {}
+        # Panel ids whose flow history gained a sample in the latest poll.
+        self.sampled_panel_ids: frozenset[int] = frozenset()
+        self.leak_detectors: dict[int, LeakDetector] = {}
+        # Scenes shown ahead of confirmation per panel id, with the monotonic
+        # deadline for the panel to report them as its active scene.
+        self._optimistic_scenes: dict[int, tuple[SceneEnum, float]] = {}
+        self._overlaid = False
+        # POLDs per panel id indexed by POLD id, and the ids of those that
+        # changed in the most recent published update.
+        self.polds: dict[int, dict[str, Pold]] = {}
+        self.changed_polds: dict[int, frozenset[str]] = {}
+        # Panel ids that appeared or were given up on in the most recent
+        # published update, so platforms can add and remove just those
+        # entities. Known panels have entities; those missing from the account
+        # map to the monotonic time they were first missed and the number of
+        # successful polls they have been missing from.
+        self.added_panel_ids: frozenset[int] = frozenset()
+        self.removed_panel_ids: frozenset[int] = frozenset()
+        self._known_panel_ids: set[int] = set()
+        self._missing_panels: dict[int, tuple[float, int]] = {}
+        self._store = snapshot_store(hass, self.config_entry.entry_id)
+
+    async def async_restore(self) -> bool:
+        """
+        Load the last persisted snapshot as stale data.
+
+        Returns True if a usable snapshot was found.
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        try:
+            panels = [
+                PANEL_STATE_ADAPTER.validate_python(panel) for panel in stored["panels"]
+            ]
+        except (KeyError, TypeError, ValidationError) as exception:
+            LOGGER.debug("Discarding persisted snapshot: %s", exception)
+            return False
+        self.data = self._publish({panel.id: panel for panel in panels}, stale=True)
+        return True
+
+    async def async_save_snapshot(self) -> None:
+        """Persist live data now, replacing the pending delayed save."""
+        if self.data is not None and not self.stale:
+            await self._store.async_save(self._data_to_store())
+
+    def set_update_interval_bounds(
+        self, minimum: timedelta, maximum: timedelta
+    ) -> None:
+        """Change the poll interval bounds, taking effect from the next poll."""
+        self.min_update_interval = minimum
+        self.max_update_interval = maximum
+        for history in self.flow_history.values():
+            history.max_gap = self._flow_max_gap()
+        if self.data is not None:
+            # Start over from the base interval; growing the current one would
+            # take another backoff step on every options save.
+            self._poll_interval = DEFAULT_UPDATE_INTERVAL
+            self._set_poll_interval(self.data["panels"], backoff=False)
+
+    @property
+    def stats_signal(self) -> str:
+        """Return the dispatcher signal sent after every refresh attempt."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_stats"
+
+    @property
+    def history_signal(self) -> str:
+        """Return the dispatcher signal sent when only flow histories changed."""
+        return f"{DOMAIN}_{self.config_entry.entry_id}_history"
 
     async def _async_update_data(self) -> CoordinatorData:
-        """Update data via library."""
+        """Update data via library, recording how long the refresh took."""
+        start = time.perf_counter()
+        try:
+            data = await self._async_fetch_data()
+            self.last_success_time = dt_util.utcnow()
+        finally:
+            self.last_update_seconds = time.perf_counter() - start
+            # Diagnostic sensors follow every attempt, including unchanged polls
+            # that do not notify the coordinator's listeners.
+            async_dispatcher_send(self.hass, self.stats_signal)
+        return data
+
+    async def _async_fetch_data(self) -> CoordinatorData:
+        """Fetch the customer and build the coordinator data."""
         try:
             customer_data = await self.config_entry.runtime_data.client.async_get_data()
         except LeakDefenseApiClientAuthenticationError as exception:
@@ -54,6 +218,422 @@ class BlueprintDataUpdateCoordinator(DataUpdateCoordinator[CoordinatorData]):
         except LeakDefenseApiClientError as exception:
             raise UpdateFailed(exception) from exception
 
+        if (
+            customer_data is self._customer
+            and self.data is not None
+            and not self._overlaid
+        ):
+            # The client returns the same object for an unchanged payload, so
+            # there is nothing to rebuild. Entities are only notified to drop
+            # the stale marker or when the time a flow lasted raised a leak.
+            suspicion_changed = self._record_flow(self.data["panels"])
+            self.changed_fields = {}
+            self.changed_polds = {}
+            self.added_panel_ids = frozenset()
+            self.removed_panel_ids = self._track_missing_panels(self.data["panels"])
+            self.always_update = (
+                self.stale or suspicion_changed or bool(self.removed_panel_ids)
+            )
+            self._async_signal_history()
+            self._set_poll_interval(self.data["panels"])
+            self._data_updated_at = time.monotonic()
+            self.stale = False
+            return self.data
+        self._customer = customer_data
+
         # Transform list of panels to a dictionary with panel ID as key
         panels_dict = {panel.id: panel for panel in customer_data.panels}
-        return {"panels": panels_dict}
+        stale = self.stale
+        suspicion_changed = self._record_flow(panels_dict)
+        data = self._publish(self._with_optimistic_scenes(panels_dict))
+        # Entities have to drop the stale marker even when the first live data
+        # equals the restored snapshot. A leak raised or cleared by how long a
+        # flow lasted, and panels given up on, reach them with equal panels too.
+        self.always_update = stale or suspicion_changed or bool(self.removed_panel_ids)
+        self._async_signal_history()
+        return data
+
+    @callback
+    def _async_signal_history(self) -> None:
+        """Send the history signal if listeners miss the new flow samples."""
+        # Listeners are only notified when forced to or the data changed; a
+        # changed payload may differ only in fields the integration ignores.
+        if (
+            not self.always_update
+            and not self.changed_fields
+            and self.sampled_panel_ids
+        ):
+            async_dispatcher_send(self.hass, self.history_signal)
+
+    def _record_flow(self, panels: dict[int, PanelState]) -> bool:
+        """
+        Add the flow reported by every online panel to its history.
+
+        Also runs the local leak detection and returns True if a suspected leak
+        was raised or cleared.
+        """
+        now = time.monotonic()
+        for panel_id in self.flow_history.keys() - panels.keys():
+            del self.flow_history[panel_id]
+        for panel_id in self.leak_detectors.keys() - panels.keys():
+            del self.leak_detectors[panel_id]
+        suspicion_changed = False
+        sampled: list[int] = []
+        for panel_id, panel in panels.items():
+            if panel.offline:
+                continue
+            if (history := self.flow_history.get(panel_id)) is None:
+                history = self.flow_history[panel_id] = FlowHistory(
+                    max_gap=self._flow_max_gap()
+                )
+            history.append(now, panel.flow_value)
+            sampled.append(panel_id)
+
+            if (detector := self.leak_detectors.get(panel_id)) is None:
+                detector = self.leak_detectors[panel_id] = LeakDetector()
+            if detector.update(now, panel):
+                suspicion_changed = True
+                if detector.suspected:
+                    self._async_leak_suspected(panel, detector.exceeded_seconds(now))
+        self.sampled_panel_ids = frozenset(sampled)
+        return suspicion_changed
+
+    def _flow_max_gap(self) -> float:
+        """Return the longest gap between flow samples that is integrated."""
+        # Polls at the longest interval may come up to half an interval late
+        # to keep their slot, see _phased.
+        return max(
+            FLOW_INTEGRATION_MAX_GAP, 2 * self.max_update_interval.total_seconds()
+        )
+
+    def leak_suspected(self, panel_id: int) -> bool:
+        """Return True if the local detection suspects a leak on the panel."""
+        detector = self.leak_detectors.get(panel_id)
+        return detector is not None and detector.suspected
+
+    @callback
+    def _async_leak_suspected(self, panel: PanelState, duration: float) -> None:
+        """Announce a suspected leak and close the valve if configured to."""
+        auto_shutoff = self.config_entry.options.get(
+            CONF_AUTO_SHUTOFF, DEFAULT_AUTO_SHUTOFF
+        )
+        LOGGER.warning(
+            "Suspected leak on panel %s: %s L/min for %.0f seconds",
+            panel.text_identifier,
+            panel.flow_value,
+            duration,
+        )
+        self.hass.bus.async_fire(
+            EVENT_SUSPECTED_LEAK,
+            {
+                "panel_id": panel.id,
+                "name": panel.text_identifier,
+                "flow_value": panel.flow_value,
+                "trip_value": panel.trip_value,
+                "duration": duration,
+                "auto_shutoff": auto_shutoff,
+            },
+        )
+        if auto_shutoff and panel.scene != SceneEnum.AWAY:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_shut_off(panel.id),
+                f"{DOMAIN} shut off panel {panel.id}",
+            )
+
+    async def _async_shut_off(self, panel_id: int) -> None:
+        """Send the AWAY scene to a panel with a suspected leak."""
+        snapshot, snapshot_age = self.panel_snapshot(panel_id)
+        self.async_set_optimistic_scene([panel_id], SceneEnum.AWAY)
+        try:
+            panel = await self.config_entry.runtime_data.client.async_send_scene(
+                scene=SceneEnum.AWAY,
+                panel_id=panel_id,
+                snapshot=snapshot,
+                snapshot_age=snapshot_age,
+            )
+        except LeakDefenseApiClientError as exception:
+            LOGGER.error("Could not shut off panel %s: %s", panel_id, exception)
+            self.async_discard_optimistic_scene(panel_id)
+            await self.async_request_refresh()
+            return
+        if panel:
+            self.async_apply_panel(panel)
+        else:
+            await self.async_request_refresh()
+
+    @callback
+    def async_apply_panel(self, panel: PanelState) -> None:
+        """Merge a single updated panel into the current data and notify entities."""
+        self.async_apply_panels([panel])
+
+    @callback
+    def async_apply_panels(self, panels: Iterable[PanelState]) -> None:
+        """Merge updated panels into the current data, notifying entities once."""
+        merged = {**self.data["panels"], **{panel.id: panel for panel in panels}}
+        self.async_set_updated_data(self._publish(self._with_optimistic_scenes(merged)))
+
+    @callback
+    def async_set_optimistic_scene(
+        self, panel_ids: Iterable[int], scene: SceneEnum
+    ) -> None:
+        """
+        Show a requested scene on the panels before the API confirms it.
+
+        The coordinator polls at the confirmation interval until each panel
+        reports the scene as active. A panel that does not within the timeout
+        falls back to the scene it reports and the scene not confirmed event
+        is fired.
+        """
+        deadline = time.monotonic() + SCENE_CONFIRM_TIMEOUT.total_seconds()
+        for panel_id in panel_ids:
+            if panel_id in self.data["panels"]:
+                self._optimistic_scenes[panel_id] = (scene, deadline)
+        self.async_set_updated_data(
+            self._publish(self._with_optimistic_scenes(self.data["panels"]))
+        )
+
+    @callback
+    def async_discard_optimistic_scene(self, panel_id: int) -> None:
+        """Stop showing the scene of a command that failed; the next poll reverts it."""
+        self._optimistic_scenes.pop(panel_id, None)
+
+    def _with_optimistic_scenes(
+        self, panels: dict[int, PanelState]
+    ) -> dict[int, PanelState]:
+        """Overlay the pending scenes, dropping those confirmed or timed out."""
+        now = time.monotonic()
+        overlaid = dict(panels)
+        for panel_id, (scene, deadline) in list(self._optimistic_scenes.items()):
+            panel = panels.get(panel_id)
+            if panel is None or panel.active_scene == scene:
+                del self._optimistic_scenes[panel_id]
+            elif now >= deadline:
+                del self._optimistic_scenes[panel_id]
+                LOGGER.warning(
+                    "Panel %s did not confirm scene %s",
+                    panel.text_identifier,
+                    scene.value,
+                )
+                self.hass.bus.async_fire(
+                    EVENT_SCENE_NOT_CONFIRMED,
+                    {
+                        "panel_id": panel_id,
+                        "scene": scene.value,
+                        "active_scene": panel.active_scene,
+                    },
+                )
+            elif panel.scene != scene:
+                overlaid[panel_id] = dataclasses.replace(panel, scene=scene.value)
+        self._overlaid = bool(self._optimistic_scenes)
+        return overlaid
+
+    def panel_changed(self, panel_id: int, fields: frozenset[str]) -> bool:
+        """Return True if any of ``fields`` changed for the panel in the last update."""
+        changed = self.changed_fields.get(panel_id)
+        if not changed:
+            return False
+        return not fields or not changed.isdisjoint(fields)
+
+    def _publish(
+        self, panels: dict[int, PanelState], *, stale: bool = False
+    ) -> CoordinatorData:
+        """Record what changed against the current data and build the new data."""
+        previous = self.data["panels"] if self.data is not None else {}
+        self.changed_fields = {
+            panel_id: changed
+            for panel_id in previous.keys() | panels.keys()
+            if (
+                changed := _changed_fields(previous.get(panel_id), panels.get(panel_id))
+            )
+        }
+        self.added_panel_ids = frozenset(panels.keys() - previous.keys())
+        self.removed_panel_ids = frozenset()
+        self._index_polds(panels)
+        self._set_poll_interval(panels)
+        self.stale = stale
+        if stale:
+            self._known_panel_ids.update(panels)
+            return {"panels": panels}
+        self.removed_panel_ids = self._track_missing_panels(panels)
+        self._fire_transitions(previous, panels)
+        self._data_updated_at = time.monotonic()
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return {"panels": panels}
+
+    def _track_missing_panels(self, panels: dict[int, PanelState]) -> frozenset[int]:
+        """
+        Count a successful poll against the known panels missing from it.
+
+        Returns the ids of the panels missing for long enough to be removed. A
+        poll without any panel, as the cloud may send during maintenance, is
+        not trusted and leaves the counts alone.
+        """
+        if not panels:
+            return frozenset()
+        now = time.monotonic()
+        for panel_id in panels.keys() & self._missing_panels.keys():
+            del self._missing_panels[panel_id]
+        for panel_id in self._known_panel_ids - panels.keys():
+            since, polls = self._missing_panels.get(panel_id, (now, 0))
+            self._missing_panels[panel_id] = (since, polls + 1)
+        self._known_panel_ids.update(panels)
+        removed = frozenset(
+            panel_id
+            for panel_id, (since, polls) in self._missing_panels.items()
+            if polls >= PANEL_REMOVAL_POLLS
+            and now - since >= PANEL_REMOVAL_DELAY.total_seconds()
+        )
+        for panel_id in removed:
+            del self._missing_panels[panel_id]
+        self._known_panel_ids -= removed
+        return removed
+
+    def _fire_transitions(
+        self, previous: dict[int, PanelState], panels: dict[int, PanelState]
+    ) -> None:
+        """Fire an event for every edge of a transition field of a panel."""
+        device_registry: dr.DeviceRegistry | None = None
+        for panel_id, fields in self.changed_fields.items():
+            if fields.isdisjoint(TRANSITION_FIELDS):
+                continue
+            old, new = previous.get(panel_id), panels.get(panel_id)
+            if old is None or new is None:
+                continue
+            if device_registry is None:
+                device_registry = dr.async_get(self.hass)
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, str(panel_id))}
+            )
+            for field in fields & TRANSITION_FIELDS:
+                value = getattr(new, field)
+                self.hass.bus.async_fire(
+                    EVENT_LEAK_DEFENSE,
+                    {
+                        "device_id": device.id if device else None,
+                        "panel_id": panel_id,
+                        "type": TRANSITION_TYPES[field, value],
+                        "field": field,
+                        "old": getattr(old, field),
+                        "new": value,
+                    },
+                )
+
+    def _index_polds(self, panels: dict[int, PanelState]) -> None:
+        """Re-index the POLDs of the panels whose POLD list changed."""
+        self.changed_polds = {}
+        for panel_id in self.polds.keys() - panels.keys():
+            del self.polds[panel_id]
+        for panel_id, fields in self.changed_fields.items():
+            if "polds" not in fields or (panel := panels.get(panel_id)) is None:
+                continue
+            previous = self.polds.get(panel_id, {})
+            current = self.polds[panel_id] = {
+                pold.id: pold for pold in panel.polds if pold.id is not None
+            }
+            self.changed_polds[panel_id] = frozenset(
+                pold_id
+                for pold_id in previous.keys() | current.keys()
+                if previous.get(pold_id) != current.get(pold_id)
+            )
+
+    def pold(self, panel_id: int, pold_id: str) -> Pold | None:
+        """Return a POLD of a panel from the current data."""
+        return self.polds.get(panel_id, {}).get(pold_id)
+
+    def pold_changed(self, panel_id: int, pold_id: str) -> bool:
+        """Return True if the POLD changed in the last update."""
+        return pold_id in self.changed_polds.get(panel_id, ())
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the current snapshot in its persisted form."""
+        return {
+            "panels": [
+                PANEL_STATE_ADAPTER.dump_python(panel, mode="json", by_alias=True)
+                for panel in self.data["panels"].values()
+            ]
+        }
+
+    def snapshot(self) -> tuple[dict[int, PanelState], timedelta | None]:
+        """Return the cached panels and the age of the snapshot they came from."""
+        if self.data is None or self._data_updated_at is None:
+            return {}, None
+        age = timedelta(seconds=time.monotonic() - self._data_updated_at)
+        return self.data["panels"], age
+
+    def panel_snapshot(
+        self, panel_id: int
+    ) -> tuple[PanelState | None, timedelta | None]:
+        """Return the cached panel and the age of the snapshot it came from."""
+        panels, age = self.snapshot()
+        return panels.get(panel_id), age
+
+    def _detection_deadline(self, panels: dict[int, PanelState]) -> timedelta:
+        """Return the time until the first pending leak detection can fire."""
+        now = time.monotonic()
+        remaining = (
+            detector.seconds_until_suspected(now, panel)
+            for panel_id, panel in panels.items()
+            if (detector := self.leak_detectors.get(panel_id)) is not None
+        )
+        seconds = min(
+            (value for value in remaining if value is not None),
+            default=None,
+        )
+        if seconds is None:
+            return self.min_update_interval
+        # Never poll more than once per second, even right at the deadline.
+        return timedelta(seconds=max(seconds, 1))
+
+    def _set_poll_interval(
+        self, panels: dict[int, PanelState], *, backoff: bool = True
+    ) -> None:
+        """Schedule the next poll from the latest snapshot."""
+        self._poll_interval = self._next_update_interval(panels, backoff=backoff)
+        self.update_interval = self._phased(self._poll_interval)
+
+    def _phased(self, interval: timedelta) -> timedelta:
+        """Shift the next poll, by at most half an interval, into this entry's slot."""
+        # Scene confirmations and leak detections are due sooner, keep them.
+        if self.poll_phase is None or interval < self.min_update_interval:
+            return interval
+        seconds = interval.total_seconds()
+        due = self.hass.loop.time() + seconds
+        shift = (self.poll_phase * seconds - due) % seconds
+        if shift > seconds / 2:
+            shift -= seconds
+        return timedelta(seconds=seconds + shift)
+
+    def _next_update_interval(
+        self, panels: dict[int, PanelState], *, backoff: bool = True
+    ) -> timedelta:
+        """
+        Pick the next poll interval from the latest snapshot.
+
+        Poll at the fast interval as soon as any online panel reports flow, an
+        alarm or a running alarm countdown, faster still while a scene awaits
+        confirmation, and poll right when a pending local leak detection is
+        due. Otherwise grow the current interval geometrically, unless
+        ``backoff`` is False, toward the slowest interval advertised by the
+        panels, or toward the offline ceiling when no panel is reachable.
+        """
+        if self._optimistic_scenes:
+            return min(SCENE_CONFIRM_INTERVAL, self._detection_deadline(panels))
+        if any(_panel_is_active(panel) for panel in panels.values()):
+            return min(self.min_update_interval, self._detection_deadline(panels))
+
+        if panels and all(panel.offline for panel in panels.values()):
+            ceiling = OFFLINE_UPDATE_INTERVAL
+        else:
+            advertised = max(
+                (panel.update_interval for panel in panels.values()),
+                default=0,
+            )
+            ceiling = max(timedelta(seconds=advertised), DEFAULT_UPDATE_INTERVAL)
+        ceiling = min(ceiling, self.max_update_interval)
+
+        current = self._poll_interval
+        if backoff:
+            current *= UPDATE_INTERVAL_BACKOFF_FACTOR
+        return max(self.min_update_interval, min(current, ceiling))
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import aiohttp
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import CALLBACK_TYPE
     from homeassistant.loader import Integration
 
     from .api import LeakDefenseApiClient
     from .coordinator import BlueprintDataUpdateCoordinator
+    from .resilience import TokenBucket
 
 
 type LeakDefenseConfigEntry = ConfigEntry[LeakDefenseData]
@@ -23,3 +28,24 @@ class LeakDefenseData:
     client: LeakDefenseApiClient
     coordinator: BlueprintDataUpdateCoordinator
     integration: Integration
+    # Copy of the entry data the client was set up with; only a change of it
+    # requires a reload, options are applied live.
+    entry_data: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LeakDefenseDomainData:
+    """Data shared by all Leak Defense config entries."""
+
+    session: aiohttp.ClientSession
+    rate_limiter: TokenBucket
+    command_rate_limiter: TokenBucket
+    entry_ids: set[str] = field(default_factory=set)
+    # Coordinators of the set up entries, which share out the poll interval.
+    coordinators: dict[str, BlueprintDataUpdateCoordinator] = field(
+        default_factory=dict
+    )
+    # Panel devices of the loaded entries: device id -> (entry id, panel id).
+    panel_devices: dict[str, tuple[str, int]] = field(default_factory=dict)
+    # Removes the listener closing the session when Home Assistant stops.
+    remove_close_listener: CALLBACK_TYPE | None = None
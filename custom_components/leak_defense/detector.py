@@ -0,0 +1,53 @@
+"""Local continuous-flow leak detection for leak_defense."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import PanelState
+
+
+class LeakDetector:
+    """
+    Suspect a leak from the flow reported by one panel.
+
+    A leak is suspected once the panel has reported a flow at or above its own
+    ``trip_value`` on every sample for ``countdown_timer`` minutes, the same
+    rule the cloud applies before raising ``in_alarm``. Running it locally on
+    every poll saves the cloud processing delay. A panel with no trip value
+    configured is never suspected.
+    """
+
+    __slots__ = ("_exceeded_since", "suspected")
+
+    def __init__(self) -> None:
+        """Initialize a detector with no flow seen."""
+        self._exceeded_since: float | None = None
+        self.suspected = False
+
+    def update(self, timestamp: float, panel: PanelState) -> bool:
+        """Add a sample of the panel and return True if the suspicion changed."""
+        was_suspected = self.suspected
+        if panel.trip_value <= 0 or panel.flow_value < panel.trip_value:
+            self._exceeded_since = None
+            self.suspected = False
+            return was_suspected
+        if self._exceeded_since is None:
+            self._exceeded_since = timestamp
+        self.suspected = timestamp - self._exceeded_since >= panel.countdown_timer * 60
+        return self.suspected != was_suspected
+
+    def seconds_until_suspected(
+        self, timestamp: float, panel: PanelState
+    ) -> float | None:
+        """Return how long the flow has to persist before a leak is suspected."""
+        if self.suspected or self._exceeded_since is None:
+            return None
+        return max(0.0, self._exceeded_since + panel.countdown_timer * 60 - timestamp)
+
+    def exceeded_seconds(self, timestamp: float) -> float:
+        """Return for how long the flow has been at or above the trip value."""
+        if self._exceeded_since is None:
+            return 0.0
+        return timestamp - self._exceeded_since
@@ -0,0 +1,63 @@
+"""Diagnostics support for leak_defense."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .api import LeakDefenseApiClientError
+from .models import PANEL_STATE_ADAPTER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import LeakDefenseConfigEntry
+
+TO_REDACT = {
+    "token",
+    "device_hash",
+    "title",
+    "unique_id",
+    "address_1",
+    "address_2",
+    "city",
+    "state",
+    "zip",
+    "main_user_id",
+    "main_user_email",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: LeakDefenseConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    # The coordinator only keeps compact panel snapshots; read the complete
+    # panels from the API, falling back to the snapshots.
+    try:
+        customer = await client.async_get_full_customer()
+    except LeakDefenseApiClientError:
+        customer = None
+    if customer is not None:
+        panels = [panel.model_dump() for panel in customer.panels]
+    else:
+        panels = [
+            PANEL_STATE_ADAPTER.dump_python(panel)
+            for panel in (coordinator.data or {}).get("panels", {}).values()
+        ]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "client": client.stats.as_dict(),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_success_time": coordinator.last_success_time,
+            "last_update_seconds": coordinator.last_update_seconds,
+            "update_interval": coordinator.update_interval,
+            "stale": coordinator.stale,
+        },
+        "panels": [async_redact_data(panel, TO_REDACT) for panel in panels],
+    }
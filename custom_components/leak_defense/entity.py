@@ -2,16 +2,76 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
+from .const import ATTR_STALE, ATTRIBUTION, DOMAIN
 from .coordinator import BlueprintDataUpdateCoordinator
 
 if TYPE_CHECKING:
-    from .models import Panel
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data import LeakDefenseConfigEntry
+    from .models import PanelState, Pold
+
+
+@callback
+def async_setup_panel_entities(
+    entry: LeakDefenseConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    panel_entities: Callable[
+        [BlueprintDataUpdateCoordinator, PanelState], Iterable[Entity]
+    ],
+    pold_entities: Callable[
+        [BlueprintDataUpdateCoordinator, PanelState, Pold], Iterable[Entity]
+    ],
+) -> None:
+    """
+    Add the entities of every panel and POLD, now and as new ones appear.
+
+    After each coordinator update only the panels the coordinator reports as
+    added, and the panels whose POLDs changed, are looked at. Entities of
+    removed panels go away with their device, see ``async_setup_entry``.
+    """
+    coordinator = entry.runtime_data.coordinator
+    known_panels: set[int] = set()
+    known_polds: defaultdict[int, set[str]] = defaultdict(set)
+
+    @callback
+    def _async_add(panel_ids: Iterable[int], pold_panel_ids: Iterable[int]) -> None:
+        panels = coordinator.data["panels"]
+        entities: list[Entity] = []
+        for panel_id in panel_ids:
+            if panel_id not in known_panels and (panel := panels.get(panel_id)):
+                known_panels.add(panel_id)
+                entities.extend(panel_entities(coordinator, panel))
+        for panel_id in pold_panel_ids:
+            if (panel := panels.get(panel_id)) is None:
+                continue
+            known = known_polds[panel_id]
+            for pold_id, pold in coordinator.polds.get(panel_id, {}).items():
+                if pold_id not in known:
+                    known.add(pold_id)
+                    entities.extend(pold_entities(coordinator, panel, pold))
+        if entities:
+            async_add_entities(entities)
+
+    @callback
+    def _async_coordinator_updated() -> None:
+        for panel_id in coordinator.removed_panel_ids:
+            known_panels.discard(panel_id)
+            known_polds.pop(panel_id, None)
+        _async_add(coordinator.added_panel_ids, coordinator.changed_polds)
+
+    _async_add(coordinator.data["panels"], coordinator.polds)
+    entry.async_on_unload(coordinator.async_add_listener(_async_coordinator_updated))
 
 
 class LeakDefenseEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
@@ -19,8 +79,12 @@ class LeakDefenseEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
 
     _attr_attribution = ATTRIBUTION
 
+    # Panel fields the entity state is derived from. The entity only writes its
+    # state when one of them changed; an empty set means any change.
+    _panel_fields: frozenset[str] = frozenset()
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, panel: PanelState
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
@@ -33,3 +97,67 @@ class LeakDefenseEntity(CoordinatorEntity[BlueprintDataUpdateCoordinator]):
             model="Water Panel",
             sw_version="1.0",
         )
+        self._written_available: bool | None = None
+        self._written_stale: bool | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as stale while it comes from the persisted snapshot."""
+        return {ATTR_STALE: True} if self.coordinator.stale else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability, staleness or a used field changed."""
+        available = self.available
+        stale = self.coordinator.stale
+        if (
+            available == self._written_available
+            and stale == self._written_stale
+            and not self._state_changed()
+        ):
+            return
+        self._written_available = available
+        self._written_stale = stale
+        super()._handle_coordinator_update()
+
+    def _state_changed(self) -> bool:
+        """Return True if the data the state is derived from changed."""
+        return self.coordinator.panel_changed(self.panel.id, self._panel_fields)
+
+
+class LeakDefensePoldEntity(LeakDefenseEntity):
+    """Entity of a remote leak sensor (POLD), attached to its panel's device."""
+
+    # Panel fields the state depends on besides the POLD itself; unlike panel
+    # entities an empty set means none.
+    _panel_fields = frozenset()
+    # Unique id suffix and name suffix of the entity.
+    _key: str
+    _label: str
+
+    def __init__(
+        self, coordinator: BlueprintDataUpdateCoordinator, panel: PanelState, pold: Pold
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, panel)
+        self.pold_id = pold.id
+        pold_name = pold.name or f"Sensor {pold.id}"
+        self._attr_name = f"{panel.text_identifier} {pold_name} {self._label}"
+        self._attr_unique_id = f"leak_defense_{panel.id}_pold_{pold.id}_{self._key}"
+
+    @property
+    def pold(self) -> Pold | None:
+        """Return the POLD from the coordinator's index."""
+        return self.coordinator.pold(self.panel.id, self.pold_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True while the panel still reports the POLD."""
+        return super().available and self.pold is not None
+
+    def _state_changed(self) -> bool:
+        """Return True if the POLD, or a panel field it depends on, changed."""
+        return self.coordinator.pold_changed(self.panel.id, self.pold_id) or (
+            bool(self._panel_fields)
+            and self.coordinator.panel_changed(self.panel.id, self._panel_fields)
+        )
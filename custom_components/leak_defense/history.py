@@ -0,0 +1,169 @@
+"""Per-panel flow history for leak_defense."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+from .const import FLOW_HISTORY_SIZE, FLOW_HISTORY_WINDOW, FLOW_INTEGRATION_MAX_GAP
+
+
+class FlowHistory:
+    """
+    Ring buffer of a panel's flow samples over a time window.
+
+    Samples are weighted by how long they were the latest reading, and the
+    rolling statistics and flow volume are updated in O(1) per sample.
+    """
+
+    __slots__ = (
+        "_count",
+        "_flow_since",
+        "_max_queue",
+        "_start",
+        "_timestamps",
+        "_values",
+        "_weighted_squares",
+        "_weighted_sum",
+        "_weights",
+        "_weights_sum",
+        "capacity",
+        "max_gap",
+        "volume",
+        "window",
+    )
+
+    def __init__(
+        self,
+        capacity: int = FLOW_HISTORY_SIZE,
+        window: float = FLOW_HISTORY_WINDOW.total_seconds(),
+        max_gap: float = FLOW_INTEGRATION_MAX_GAP,
+    ) -> None:
+        """Initialize an empty history."""
+        self.capacity = capacity
+        self.window = window
+        # Longest gap between samples the flow is integrated and weighted over.
+        self.max_gap = max_gap
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Seconds each sample was the latest one, zero for the newest sample.
+        self._weights = array("d", bytes(8 * capacity))
+        # Numbers of the oldest sample in the window and of the next sample.
+        self._start = 0
+        self._count = 0
+        self._weights_sum = 0.0
+        self._weighted_sum = 0.0
+        self._weighted_squares = 0.0
+        # (sample number, value) pairs with decreasing values; the head is the
+        # maximum of the window.
+        self._max_queue: deque[tuple[int, float]] = deque()
+        self._flow_since: float | None = None
+        self.volume = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._count - self._start
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting those that left the window."""
+        if (latest := self.latest) is not None:
+            elapsed = timestamp - latest[0]
+            if 0 < elapsed <= self.max_gap:
+                # Flow is in L/min, timestamps in seconds.
+                self.volume += (latest[1] + value) / 2 * elapsed / 60
+                # The previous reading held until now. Across longer gaps
+                # (outages, offline panels) it is not known and weighs nothing.
+                self._set_weight((self._count - 1) % self.capacity, elapsed)
+
+        if len(self) >= self.capacity:
+            self._evict()
+        index = self._count % self.capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self._weights[index] = 0.0
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((self._count, value))
+        self._count += 1
+
+        # Drop the samples whose reading ended before the window started.
+        cutoff = timestamp - self.window
+        while len(self) > 1:
+            oldest = self._start % self.capacity
+            if self._timestamps[oldest] + self._weights[oldest] > cutoff:
+                break
+            self._evict()
+
+        if value <= 0:
+            self._flow_since = None
+        elif self._flow_since is None:
+            self._flow_since = timestamp
+
+    def _set_weight(self, index: int, weight: float) -> None:
+        """Set the weight of the sample at ``index``, which had none."""
+        value = self._values[index]
+        self._weights[index] = weight
+        self._weights_sum += weight
+        self._weighted_sum += value * weight
+        self._weighted_squares += value * value * weight
+
+    def _evict(self) -> None:
+        """Remove the oldest sample from the window."""
+        index = self._start % self.capacity
+        value = self._values[index]
+        weight = self._weights[index]
+        self._weights_sum -= weight
+        self._weighted_sum -= value * weight
+        self._weighted_squares -= value * value * weight
+        if self._max_queue[0][0] == self._start:
+            self._max_queue.popleft()
+        self._start += 1
+        if len(self) <= 1:
+            # Only the newest sample is left and it has no weight yet; drop
+            # the rounding error the running sums collected.
+            self._weights_sum = self._weighted_sum = self._weighted_squares = 0.0
+
+    @property
+    def latest(self) -> tuple[float, float] | None:
+        """Return the most recent (timestamp, value) sample."""
+        if not len(self):
+            return None
+        index = (self._count - 1) % self.capacity
+        return self._timestamps[index], self._values[index]
+
+    @property
+    def mean(self) -> float | None:
+        """Return the time-weighted mean flow over the window."""
+        if (latest := self.latest) is None:
+            return None
+        if self._weights_sum <= 0:
+            return latest[1]
+        return self._weighted_sum / self._weights_sum
+
+    @property
+    def variance(self) -> float | None:
+        """Return the time-weighted population variance of the flow."""
+        if not len(self):
+            return None
+        if self._weights_sum <= 0:
+            return 0.0
+        mean = self._weighted_sum / self._weights_sum
+        # Clamp the rounding error of the running sums.
+        return max(0.0, self._weighted_squares / self._weights_sum - mean * mean)
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the highest flow over the window."""
+        return self._max_queue[0][1] if self._max_queue else None
+
+    @property
+    def flow_since(self) -> float | None:
+        """Return the timestamp of the first sample of the current flow run."""
+        return self._flow_since
+
+    def continuous_flow_seconds(self) -> float:
+        """Return for how long flow has been reported without interruption."""
+        latest = self.latest
+        if self._flow_since is None or latest is None:
+            return 0.0
+        return latest[0] - self._flow_since
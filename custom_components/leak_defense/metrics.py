@@ -0,0 +1,66 @@
+"""Lightweight request metrics for the Leak Defense API client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds in seconds of the latency histogram buckets; a final bucket
+# collects everything slower.
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, O(log buckets) per observation."""
+
+    bounds: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add an observation."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in a JSON friendly form."""
+        labels = [f"le_{bound}" for bound in self.bounds] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.maximum,
+        }
+
+
+@dataclass
+class EndpointStats:
+    """Latency and response size of the requests made to one endpoint."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    last_latency: float | None = None
+    last_response_bytes: int | None = None
+    response_bytes: int = 0
+
+    def record(self, seconds: float, response_bytes: int | None) -> None:
+        """Record a completed request attempt."""
+        self.latency.observe(seconds)
+        self.last_latency = seconds
+        if response_bytes is not None:
+            self.last_response_bytes = response_bytes
+            self.response_bytes += response_bytes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a JSON friendly form."""
+        return {
+            "latency": self.latency.as_dict(),
+            "last_latency": self.last_latency,
+            "last_response_bytes": self.last_response_bytes,
+            "response_bytes": self.response_bytes,
+        }
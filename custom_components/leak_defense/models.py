@@ -1,8 +1,20 @@
 """Models for the Leak Defense API."""
 
+import contextlib
+from datetime import datetime
 from enum import Enum
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
+from pydantic.dataclasses import dataclass
 
 
 class TokenResponse(BaseModel):
@@ -16,6 +28,84 @@ class TokenResponse(BaseModel):
     phone_confirmed: bool | None = Field(alias="phoneConfirmed")
 
 
+# Non ISO 8601 formats tried for a POLD's last seen time.
+_POLD_DATETIME_FORMATS = (
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+)
+
+
+def _none_if_invalid(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate a value, returning None instead of failing."""
+    try:
+        return handler(value)
+    except ValidationError:
+        return None
+
+
+def _lenient_datetime(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Parse ISO 8601 or a known US formatted date, otherwise return None."""
+    try:
+        return handler(value)
+    except ValidationError:
+        pass
+    if isinstance(value, str):
+        for date_format in _POLD_DATETIME_FORMATS:
+            with contextlib.suppress(ValueError):
+                # Naive, like the ISO dates without an offset the API sends.
+                return datetime.strptime(value.strip(), date_format)  # noqa: DTZ007
+    return None
+
+
+_LenientBool = Annotated[bool | None, WrapValidator(_none_if_invalid)]
+_LenientStr = Annotated[str | None, WrapValidator(_none_if_invalid)]
+
+
+@dataclass(
+    frozen=True,
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(populate_by_name=True, coerce_numbers_to_str=True),
+)
+class Pold:
+    """
+    A remote leak sensor (POLD) reported in a panel's ``polds`` list.
+
+    The API does not document these entries, so every field is optional.
+    Missing fields fall back to a neutral default and values that cannot be
+    parsed become None rather than failing the whole response. Entries
+    without an id are kept but get no entities.
+    """
+
+    id: _LenientStr = None
+    name: _LenientStr = None
+    in_alarm: _LenientBool = Field(default=False, alias="inAlarm")
+    battery_low: _LenientBool = Field(default=False, alias="batteryLow")
+    offline: _LenientBool = False
+    last_seen: Annotated[datetime | None, WrapValidator(_lenient_datetime)] = Field(
+        default=None, alias="lastSeen"
+    )
+
+
+def _drop_invalid_polds(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate a POLD list, dropping the entries that are not POLDs at all."""
+    try:
+        return handler(value)
+    except ValidationError:
+        if not isinstance(value, list | tuple):
+            return handler([])
+        polds: list[Pold] = []
+        for item in value:
+            with contextlib.suppress(ValidationError):
+                polds.extend(handler([item]))
+        return handler(polds)
+
+
+_Polds = Annotated[tuple[Pold, ...], WrapValidator(_drop_invalid_polds)]
+
+
 class Panel(BaseModel):
     """Panel model."""
 
@@ -57,7 +147,7 @@ class Panel(BaseModel):
     standby_pct_exhausted: float = Field(alias="standbyPctExhausted")
     can_cancel_standby: bool = Field(alias="canCancelStandby")
     water_on_by_standby: bool = Field(alias="waterOnByStandby")
-    polds: list
+    polds: Annotated[list[Pold], WrapValidator(_drop_invalid_polds)]
     needs_update: bool = Field(alias="needsUpdate")
     needs_update_msg: str | None = Field(alias="needsUpdateMsg")
     has_wired_sensor: bool = Field(alias="hasWiredSensor")
@@ -112,6 +202,39 @@ class Panel(BaseModel):
     text_identifier: str = Field(alias="textIdentifier")
 
 
+@dataclass(
+    frozen=True, slots=True, kw_only=True, config=ConfigDict(populate_by_name=True)
+)
+class PanelState:
+    """
+    Compact, immutable snapshot of the panel fields the integration reads.
+
+    Validated straight from the same JSON as ``Panel``, ignoring every other
+    field, so the coordinator keeps a few slots per panel instead of the full
+    model. The full ``Panel`` is only read for diagnostics.
+    """
+
+    id: int
+    text_identifier: str = Field(alias="textIdentifier")
+    scene: str
+    active_scene: str = Field(alias="activeScene")
+    water_on: bool = Field(alias="waterOn")
+    offline: bool
+    too_cold: bool = Field(alias="tooCold")
+    in_alarm: bool = Field(alias="inAlarm")
+    flow_value: float = Field(alias="flowValue")
+    trip_value: float = Field(alias="tripValue")
+    countdown_timer: float = Field(alias="countdownTimer")
+    time_to_alarm: float = Field(alias="timeToAlarm")
+    update_interval: int = Field(alias="updateInterval")
+    updated_date: str = Field(alias="updatedDate")
+    pold_alarm_id: str | None = Field(default=None, alias="poldAlarmId")
+    polds: _Polds = ()
+
+
+PANEL_STATE_ADAPTER = TypeAdapter(PanelState)
+
+
 class NewFeature(BaseModel):
     """NewFeature model."""
 
@@ -142,6 +265,24 @@ class Customer(BaseModel):
     show_tutorial: bool = Field(alias="showTutorial")
 
 
+class CustomerResponse(BaseModel):
+    """Envelope of the /Customer/GetV3 response, validated straight from bytes."""
+
+    customer: Customer
+
+
+class CustomerState(BaseModel):
+    """The panels of a customer as compact snapshots."""
+
+    panels: list[PanelState]
+
+
+class CustomerStateResponse(BaseModel):
+    """Envelope of the /Customer/GetV3 response, reduced to the panel snapshots."""
+
+    customer: CustomerState
+
+
 class ApiResponse(BaseModel):
     """ApiResponse model."""
 
@@ -0,0 +1,127 @@
+"""Retry, circuit breaker and rate limiting helpers for the Leak Defense API client."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+@dataclass
+class RetryPolicy:
+    """Bounded retries with jittered exponential backoff."""
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying after the given failed attempt."""
+        # Full jitter spreads the retries of many clients over the whole window
+        # instead of having them all return at the same moment.
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))  # noqa: S311
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint after consecutive failures.
+
+    Once ``failure_threshold`` consecutive failures are recorded the breaker
+    opens and rejects requests. After ``reset_timeout`` seconds it lets a single
+    probe request through; its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """Initialize the breaker in the closed state."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Return the current state."""
+        if (
+            self._state is BreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            return BreakerState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return True
+        if state is BreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self.consecutive_failures = 0
+        self._state = BreakerState.CLOSED
+        self._probing = False
+
+    def release(self) -> None:
+        """
+        End a probe without recording an outcome.
+
+        Used when a request ended in a way that says nothing about the health
+        of the endpoint, such as a rejected request or a cancellation, so the
+        next request may probe instead.
+        """
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        self.consecutive_failures += 1
+        if self._probing or self.consecutive_failures >= self.failure_threshold:
+            self._state = BreakerState.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Each request takes
+    one token and waits for the bucket to refill when it is empty, so bursts of
+    up to ``capacity`` requests pass at once and the sustained rate is bounded.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
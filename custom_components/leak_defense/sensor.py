@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
 
-from .entity import LeakDefenseEntity
+from .const import ATTRIBUTION, DOMAIN
+from .entity import (
+    LeakDefenseEntity,
+    LeakDefensePoldEntity,
+    async_setup_panel_entities,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
-    from custom_components.leak_defense.models import Panel
+    from custom_components.leak_defense.models import PanelState, Pold
 
     from .coordinator import BlueprintDataUpdateCoordinator
-    from .data import LeakDefenseConfigEntry
+    from .data import LeakDefenseConfigEntry, LeakDefenseData
+    from .history import FlowHistory
 
 ENTITY_DESCRIPTIONS = (
     SensorEntityDescription(
@@ -26,33 +53,158 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+def _seconds_to_ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _endpoint_stat(data: LeakDefenseData, attribute: str) -> StateType:
+    stats = data.client.stats.endpoints.get("/Customer/GetV3")
+    return getattr(stats, attribute) if stats else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class LeakDefenseDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a Leak Defense diagnostic sensor."""
+
+    value_fn: Callable[[LeakDefenseData], StateType | datetime]
+
+
+DIAGNOSTIC_DESCRIPTIONS = (
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="api_latency",
+        name="API latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda data: _seconds_to_ms(_endpoint_stat(data, "last_latency")),
+    ),
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="response_size",
+        name="Response size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda data: _endpoint_stat(data, "last_response_bytes"),
+    ),
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="parse_time",
+        name="Parse time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda data: _seconds_to_ms(data.client.stats.last_parse_seconds),
+    ),
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="update_duration",
+        name="Update duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda data: _seconds_to_ms(data.coordinator.last_update_seconds),
+    ),
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="retries",
+        name="Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda data: data.client.stats.retries,
+    ),
+    LeakDefenseDiagnosticSensorEntityDescription(
+        key="last_successful_poll",
+        name="Last successful poll",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda data: data.coordinator.last_success_time,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LeakDefenseFlowSensorEntityDescription(SensorEntityDescription):
+    """Describes a rolling statistic of a panel's flow."""
+
+    value_fn: Callable[[FlowHistory], float | None]
+
+
+FLOW_STATISTIC_DESCRIPTIONS = (
+    LeakDefenseFlowSensorEntityDescription(
+        key="flow_mean",
+        name="Flow Mean",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="L/min",
+        suggested_display_precision=2,
+        value_fn=lambda history: history.mean,
+    ),
+    LeakDefenseFlowSensorEntityDescription(
+        key="flow_max",
+        name="Flow Max",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="L/min",
+        suggested_display_precision=2,
+        value_fn=lambda history: history.maximum,
+    ),
+    LeakDefenseFlowSensorEntityDescription(
+        key="flow_variance",
+        name="Flow Variance",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="L²/min²",
+        suggested_display_precision=3,
+        value_fn=lambda history: history.variance,
+    ),
+    LeakDefenseFlowSensorEntityDescription(
+        key="continuous_flow",
+        name="Continuous Flow",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda history: round(history.continuous_flow_seconds()),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: LeakDefenseConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities."""
-    coordinator: BlueprintDataUpdateCoordinator = entry.runtime_data.coordinator
+    async_setup_panel_entities(
+        entry, async_add_entities, _panel_entities, _pold_entities
+    )
+    async_add_entities(
+        LeakDefenseDiagnosticSensor(entry, description)
+        for description in DIAGNOSTIC_DESCRIPTIONS
+    )
 
-    # Ensure initial data fetch
-    await coordinator.async_config_entry_first_refresh()
 
-    # Create entities for each panel
-    entities: list[SensorEntity] = []
+def _panel_entities(
+    coordinator: BlueprintDataUpdateCoordinator, panel: PanelState
+) -> list[SensorEntity]:
+    """Create the sensors of a panel."""
+    return [
+        PanelSceneSensor(coordinator, panel),
+        PanelFlowValueSensor(coordinator, panel),
+        PanelTripValueSensor(coordinator, panel),
+        *(
+            PanelFlowStatisticSensor(coordinator, panel, description)
+            for description in FLOW_STATISTIC_DESCRIPTIONS
+        ),
+        PanelWaterVolumeSensor(coordinator, panel),
+    ]
 
-    for panel in coordinator.data["panels"].values():
-        entities.append(PanelSceneSensor(coordinator, panel))
-        entities.append(PanelFlowValueSensor(coordinator, panel))
-        entities.append(PanelTripValueSensor(coordinator, panel))
 
-    async_add_entities(entities)
+def _pold_entities(
+    coordinator: BlueprintDataUpdateCoordinator, panel: PanelState, pold: Pold
+) -> list[SensorEntity]:
+    """Create the sensors of a POLD."""
+    return [PoldLastSeenSensor(coordinator, panel, pold)]
 
 
 class PanelSceneSensor(LeakDefenseEntity, SensorEntity):
     """Sensor for the panel's scene."""
 
+    _panel_fields = frozenset({"scene"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the scene sensor."""
         super().__init__(coordinator, inital_panel)
@@ -71,8 +223,10 @@ class PanelSceneSensor(LeakDefenseEntity, SensorEntity):
 class PanelFlowValueSensor(LeakDefenseEntity, SensorEntity):
     """Sensor for the panel's flow value."""
 
+    _panel_fields = frozenset({"flow_value"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the flow value sensor."""
         super().__init__(coordinator, panel=inital_panel)
@@ -82,17 +236,19 @@ class PanelFlowValueSensor(LeakDefenseEntity, SensorEntity):
         self._attr_native_unit_of_measurement = "L/min"
 
     @property
-    def native_value(self) -> float:
-        """Return the flow value."""
+    def native_value(self) -> float | None:
+        """Return the flow value, unknown while the panel is missing."""
         updated_panel = self.coordinator.data["panels"].get(self.panel.id)
-        return updated_panel.flow_value if updated_panel else float("nan")
+        return updated_panel.flow_value if updated_panel else None
 
 
 class PanelTripValueSensor(LeakDefenseEntity, SensorEntity):
     """Sensor for the panel's trip value."""
 
+    _panel_fields = frozenset({"trip_value"})
+
     def __init__(
-        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: Panel
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
     ) -> None:
         """Initialize the trip value sensor."""
         super().__init__(coordinator, panel=inital_panel)
@@ -102,7 +258,171 @@ class PanelTripValueSensor(LeakDefenseEntity, SensorEntity):
         self._attr_native_unit_of_measurement = "L/min"
 
     @property
-    def native_value(self) -> float:
-        """Return the trip value."""
+    def native_value(self) -> float | None:
+        """Return the trip value, unknown while the panel is missing."""
         updated_panel = self.coordinator.data["panels"].get(self.panel.id)
-        return updated_panel.trip_value if updated_panel else float("nan")
+        return updated_panel.trip_value if updated_panel else None
+
+
+class PanelFlowHistoryEntity(LeakDefenseEntity):
+    """
+    Base entity for a state derived from the panel's flow history.
+
+    The history gains a sample with every poll of an online panel, including
+    polls that return unchanged data and do not notify coordinator listeners.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the histories on polls that leave the data unchanged."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.history_signal,
+                self._handle_coordinator_update,
+            )
+        )
+
+    def _state_changed(self) -> bool:
+        """Return True if the panel's history gained a sample."""
+        return self.panel.id in self.coordinator.sampled_panel_ids
+
+
+class PanelFlowStatisticSensor(PanelFlowHistoryEntity, SensorEntity):
+    """Sensor for a rolling statistic of the panel's flow history."""
+
+    entity_description: LeakDefenseFlowSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BlueprintDataUpdateCoordinator,
+        inital_panel: PanelState,
+        description: LeakDefenseFlowSensorEntityDescription,
+    ) -> None:
+        """Initialize the flow statistic sensor."""
+        super().__init__(coordinator, panel=inital_panel)
+        self.entity_description = description
+        self._attr_name = f"{inital_panel.text_identifier} {description.name}"
+        self._attr_unique_id = f"leak_defense_{inital_panel.id}_{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic over the panel's flow history."""
+        history = self.coordinator.flow_history.get(self.panel.id)
+        return self.entity_description.value_fn(history) if history else None
+
+
+class PanelWaterVolumeSensor(PanelFlowHistoryEntity, RestoreSensor):
+    """Total water volume that flowed through the panel."""
+
+    _attr_device_class = SensorDeviceClass.WATER
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_suggested_display_precision = 1
+
+    def __init__(
+        self, coordinator: BlueprintDataUpdateCoordinator, inital_panel: PanelState
+    ) -> None:
+        """Initialize the water volume sensor."""
+        super().__init__(coordinator, panel=inital_panel)
+        self._attr_name = f"{inital_panel.text_identifier} Water Volume"
+        self._attr_unique_id = f"leak_defense_{inital_panel.id}_water_volume"
+        self._total = 0.0
+        # Flow history integral already added to the total.
+        self._history: FlowHistory | None = None
+        self._counted_volume = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the accumulated volume."""
+        await super().async_added_to_hass()
+        if (
+            last := await self.async_get_last_sensor_data()
+        ) is not None and last.native_value is not None:
+            self._total = float(last.native_value)
+        self._accumulate()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Add the volume integrated since the previous update."""
+        self._accumulate()
+        super()._handle_coordinator_update()
+
+    def _accumulate(self) -> None:
+        """Add the growth of the panel's flow integral to the total, in O(1)."""
+        history = self.coordinator.flow_history.get(self.panel.id)
+        if history is None:
+            return
+        if history is not self._history:
+            # A new history integrates from zero since it was created.
+            self._history = history
+            self._counted_volume = 0.0
+        self._total += history.volume - self._counted_volume
+        self._counted_volume = history.volume
+
+    @property
+    def native_value(self) -> float:
+        """Return the total volume."""
+        return round(self._total, 3)
+
+
+class PoldLastSeenSensor(LeakDefensePoldEntity, SensorEntity):
+    """Sensor for when a remote leak sensor last reported to its panel."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key = "last_seen"
+    _label = "Last Seen"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the last report time, taking naive times as UTC."""
+        pold = self.pold
+        if pold is None or pold.last_seen is None:
+            return None
+        if pold.last_seen.tzinfo is None:
+            return pold.last_seen.replace(tzinfo=dt_util.UTC)
+        return pold.last_seen
+
+
+class LeakDefenseDiagnosticSensor(SensorEntity):
+    """Diagnostic sensor reporting how the account's API requests perform."""
+
+    entity_description: LeakDefenseDiagnosticSensorEntityDescription
+
+    _attr_attribution = ATTRIBUTION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Named after the account device, every entry has its own set.
+    _attr_has_entity_name = True
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry: LeakDefenseConfigEntry,
+        description: LeakDefenseDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        self.entity_description = description
+        self._entry = entry
+        self._attr_unique_id = f"leak_defense_{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Leak Defense {entry.title}",
+            manufacturer="Leak Defense",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the coordinator's refresh attempts."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self._entry.runtime_data.coordinator.stats_signal,
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the current value."""
+        return self.entity_description.value_fn(self._entry.runtime_data)
@@ -0,0 +1,223 @@
+"""Services for leak_defense."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .api import LeakDefenseApiClientError
+from .const import CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY, DOMAIN
+from .models import PanelState, SceneEnum
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant, ServiceCall
+
+    from .data import LeakDefenseConfigEntry, LeakDefenseDomainData
+
+SERVICE_SET_SCENE = "set_scene"
+ATTR_SCENE = "scene"
+
+SET_SCENE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **cv.TARGET_SERVICE_FIELDS,
+            vol.Required(ATTR_SCENE): vol.In([scene.value for scene in SceneEnum]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID, ATTR_AREA_ID),
+)
+
+
+def _device_panel_id(device: dr.DeviceEntry) -> int | None:
+    """Return the panel id of a device, None for the account device."""
+    return next(
+        (
+            int(id_)
+            for domain, id_ in device.identifiers
+            if domain == DOMAIN and id_.isdigit()
+        ),
+        None,
+    )
+
+
+def _async_resolve_panels(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, set[int]]:
+    """Return the targeted panel ids grouped by config entry id."""
+    domain_data: LeakDefenseDomainData | None = hass.data.get(DOMAIN)
+    if domain_data is None:
+        return {}
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_registry = er.async_get(hass)
+
+    device_ids = set(selected.referenced_devices)
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        if (entity := entity_registry.async_get(entity_id)) and entity.device_id:
+            device_ids.add(entity.device_id)
+
+    targets: dict[str, set[int]] = defaultdict(set)
+    for device_id in device_ids:
+        if (target := domain_data.panel_devices.get(device_id)) is not None:
+            entry_id, panel_id = target
+            targets[entry_id].add(panel_id)
+    return targets
+
+
+@callback
+def _async_index_device(
+    domain_data: LeakDefenseDomainData, device: dr.DeviceEntry
+) -> None:
+    """Add a panel device of a loaded entry to the routing index."""
+    if (panel_id := _device_panel_id(device)) is None:
+        return
+    entry_id = next(iter(device.config_entries & domain_data.entry_ids), None)
+    if entry_id is None:
+        domain_data.panel_devices.pop(device.id, None)
+    else:
+        domain_data.panel_devices[device.id] = (entry_id, panel_id)
+
+
+@callback
+def async_index_entry_devices(
+    hass: HomeAssistant, entry: LeakDefenseConfigEntry
+) -> None:
+    """Index the panel devices of an entry once its platforms are set up."""
+    domain_data: LeakDefenseDomainData = hass.data[DOMAIN]
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        _async_index_device(domain_data, device)
+
+
+@callback
+def _async_device_registry_updated(
+    hass: HomeAssistant, event: Event[dr.EventDeviceRegistryUpdatedData]
+) -> None:
+    """Keep the routing index in step with devices being added and removed."""
+    domain_data: LeakDefenseDomainData | None = hass.data.get(DOMAIN)
+    if domain_data is None:
+        return
+    device_id = event.data["device_id"]
+    if event.data["action"] == "remove":
+        domain_data.panel_devices.pop(device_id, None)
+    elif device := dr.async_get(hass).async_get(device_id):
+        _async_index_device(domain_data, device)
+
+
+async def _async_set_entry_scene(
+    entry: LeakDefenseConfigEntry, scene: SceneEnum, panel_ids: set[int]
+) -> list[BaseException]:
+    """
+    Send a scene to several panels of one entry concurrently.
+
+    The scene is shown optimistically right away. Every command is built from
+    one shared snapshot, read once up front when the coordinator's copy is too
+    old. The returned panels are applied to the coordinator in a single update
+    and one refresh covers any panel that did not come back. Returns the
+    errors of the failed commands.
+    """
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+
+    coordinator.async_set_optimistic_scene(panel_ids, scene)
+    snapshot, snapshot_age = coordinator.snapshot()
+    if snapshot_age is None or snapshot_age > client.max_snapshot_age:
+        try:
+            customer = await client.async_get_data()
+        except LeakDefenseApiClientError:
+            for panel_id in panel_ids:
+                coordinator.async_discard_optimistic_scene(panel_id)
+            await coordinator.async_request_refresh()
+            raise
+        snapshot = {panel.id: panel for panel in customer.panels}
+        snapshot_age = timedelta(0)
+
+    # Held by the client only while sending, so the commands are debounced
+    # together rather than one wave at a time.
+    limiter = asyncio.Semaphore(
+        int(entry.options.get(CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY))
+    )
+    ordered_ids = list(panel_ids)
+    results = await asyncio.gather(
+        *(
+            client.async_send_scene(
+                scene=scene,
+                panel_id=panel_id,
+                snapshot=snapshot.get(panel_id),
+                snapshot_age=snapshot_age,
+                limiter=limiter,
+            )
+            for panel_id in ordered_ids
+        ),
+        return_exceptions=True,
+    )
+    panels = [result for result in results if isinstance(result, PanelState)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for panel_id, result in zip(ordered_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            coordinator.async_discard_optimistic_scene(panel_id)
+
+    if panels:
+        coordinator.async_apply_panels(panels)
+    if len(panels) < len(results):
+        await coordinator.async_request_refresh()
+    return errors
+
+
+async def async_set_scene(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle setting the scene of the targeted panels."""
+    scene = SceneEnum(call.data[ATTR_SCENE])
+    targets = _async_resolve_panels(hass, call)
+    if not targets:
+        msg = "No Leak Defense panel found for the service target"
+        raise ValueError(msg)
+
+    entry_errors = await asyncio.gather(
+        *(
+            _async_set_entry_scene(
+                hass.config_entries.async_get_entry(entry_id), scene, panel_ids
+            )
+            for entry_id, panel_ids in targets.items()
+        ),
+        return_exceptions=True,
+    )
+    errors: list[BaseException] = []
+    for result in entry_errors:
+        errors.extend([result] if isinstance(result, BaseException) else result)
+    if errors:
+        msg = f"Could not set the scene of {len(errors)} target(s): {errors[0]}"
+        raise HomeAssistantError(msg) from errors[0]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """
+    Register the Leak Defense services.
+
+    Called once at component setup. Calls are routed to the entry owning each
+    targeted panel through the device index kept in the domain data.
+    """
+
+    async def _async_set_scene(call: ServiceCall) -> None:
+        await async_set_scene(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCENE,
+        _async_set_scene,
+        schema=SET_SCENE_SCHEMA,
+    )
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        partial(_async_device_registry_updated, hass),
+    )
@@ -0,0 +1,29 @@
+"""Tests for the Leak Defense integration."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from benchmarks.payloads import make_panel
+from custom_components.leak_defense.models import (
+    PANEL_STATE_ADAPTER,
+    CustomerState,
+    PanelState,
+)
+
+
+def make_panel_state(panel_id: int, **changes: Any) -> PanelState:
+    """Return a panel snapshot with ``changes`` applied to its fields."""
+    panel = PANEL_STATE_ADAPTER.validate_python(make_panel(panel_id))
+    return dataclasses.replace(panel, **changes)
+
+
+def make_customer(*panels: int | PanelState) -> CustomerState:
+    """Return a customer with the given panels, panel 1 and 2 by default."""
+    return CustomerState(
+        panels=[
+            make_panel_state(panel) if isinstance(panel, int) else panel
+            for panel in panels or (1, 2)
+        ]
+    )
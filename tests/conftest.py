@@ -0,0 +1,96 @@
+"""Fixtures for the Leak Defense tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.stub_server import StubConfig, start_stub_server
+from custom_components.leak_defense.api import LeakDefenseApiClient
+from custom_components.leak_defense.const import DOMAIN
+
+from . import make_customer
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator
+
+    from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,  # noqa: ARG001
+) -> None:
+    """Load the integration from custom_components in every test."""
+    return
+
+
+@pytest.fixture
+def stub_config() -> StubConfig:
+    """Return the behaviour of the stub server, parametrize to change it."""
+    return StubConfig(panel_count=2, seed=0)
+
+
+@pytest.fixture
+async def stub_url(stub_config: StubConfig) -> AsyncGenerator[str]:
+    """Serve the stub API and return its base URL."""
+    runner, base_url = await start_stub_server(stub_config)
+    yield base_url
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def client(stub_url: str) -> AsyncGenerator[LeakDefenseApiClient]:
+    """Return an API client talking to the stub server."""
+    async with aiohttp.ClientSession() as session:
+        client = LeakDefenseApiClient(
+            session=session,
+            token="token",  # noqa: S106
+            device_hash="hash",
+            scene_debounce=0,
+        )
+        client._base_url = stub_url
+        yield client
+
+
+@pytest.fixture
+def mock_get_data() -> Generator[AsyncMock]:
+    """Answer the entries' polls with the mock's return value."""
+    with (
+        patch(
+            "custom_components.leak_defense.create_session",
+            return_value=MagicMock(spec=aiohttp.ClientSession),
+        ),
+        patch.object(
+            LeakDefenseApiClient, "async_get_data", return_value=make_customer()
+        ) as mock,
+    ):
+        yield mock
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a Leak Defense entry added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Home",
+        data={"token": "token", "device_hash": "hash"},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_get_data: AsyncMock,  # noqa: ARG001
+) -> MockConfigEntry:
+    """Set up the entry with the mocked polls."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
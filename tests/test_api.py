@@ -0,0 +1,153 @@
+"""Tests for the Leak Defense API client."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.stub_server import StubConfig
+from custom_components.leak_defense.api import LeakDefenseApiClientCommunicationError
+from custom_components.leak_defense.models import SceneEnum
+from custom_components.leak_defense.resilience import (
+    BreakerState,
+    RetryPolicy,
+    TokenBucket,
+)
+
+from . import make_panel_state
+
+if TYPE_CHECKING:
+    from custom_components.leak_defense.api import LeakDefenseApiClient
+
+
+async def test_unchanged_body_is_not_parsed_again(
+    client: LeakDefenseApiClient,
+) -> None:
+    """An identical response body returns the previous customer object."""
+    first = await client.async_get_data()
+
+    assert await client.async_get_data() is first
+    assert client.stats.requests == 2
+    assert client.stats.parses == 1
+
+
+@pytest.mark.parametrize("stub_config", [StubConfig(panel_count=2, vary=True)])
+async def test_changed_body_is_parsed(client: LeakDefenseApiClient) -> None:
+    """A changed response body is parsed into a new customer object."""
+    first = await client.async_get_data()
+    second = await client.async_get_data()
+
+    assert second is not first
+    assert second.panels[0].id == first.panels[0].id
+    assert client.stats.parses == 2
+
+
+@pytest.mark.parametrize("stub_config", [StubConfig(failure_rate=1.0)])
+async def test_get_is_retried(client: LeakDefenseApiClient) -> None:
+    """A failing poll is retried up to the configured attempts."""
+    client.retry_policy = RetryPolicy(attempts=3, base_delay=0)
+
+    with pytest.raises(LeakDefenseApiClientCommunicationError):
+        await client.async_get_data()
+
+    assert client.stats.requests == 3
+    assert client.stats.retries == 2
+
+
+@pytest.mark.parametrize("stub_config", [StubConfig(failure_rate=1.0)])
+async def test_command_is_not_retried(client: LeakDefenseApiClient) -> None:
+    """A failing scene command is sent once."""
+    client.retry_policy = RetryPolicy(attempts=3, base_delay=0)
+
+    with pytest.raises(LeakDefenseApiClientCommunicationError):
+        await client.async_send_scene(
+            SceneEnum.AWAY, 1, make_panel_state(1), timedelta(0)
+        )
+
+    assert client.stats.requests == 1
+    assert client.stats.retries == 0
+
+
+@pytest.mark.parametrize("stub_config", [StubConfig(failure_rate=1.0)])
+async def test_breaker_stops_polling(client: LeakDefenseApiClient) -> None:
+    """Polls are rejected without a request once the breaker opened."""
+    client.retry_policy = RetryPolicy(attempts=1)
+    for _ in range(5):
+        with pytest.raises(LeakDefenseApiClientCommunicationError):
+            await client.async_get_data()
+    assert client.stats.breaker_states["/Customer/GetV3"] is BreakerState.OPEN
+
+    with pytest.raises(LeakDefenseApiClientCommunicationError):
+        await client.async_get_data()
+
+    assert client.stats.requests == 5
+    assert client.stats.breaker_rejections == 1
+
+
+async def test_commands_have_their_own_rate_budget(
+    client: LeakDefenseApiClient,
+) -> None:
+    """A command is not held up by polls that used up the read budget."""
+    client._rate_limiter = TokenBucket(rate=0.001, capacity=1)
+    client._command_rate_limiter = TokenBucket(rate=0.001, capacity=1)
+    await client.async_get_data()
+
+    async with asyncio.timeout(1):
+        panel = await client.async_send_scene(
+            SceneEnum.AWAY, 1, make_panel_state(1), timedelta(0)
+        )
+
+    assert panel is not None
+    assert panel.scene == SceneEnum.AWAY
+
+
+async def test_newer_scene_replaces_waiting_one(client: LeakDefenseApiClient) -> None:
+    """Scenes sent within the debounce window result in one command."""
+    client.scene_debounce = 0.05
+    panel = make_panel_state(1)
+
+    results = await asyncio.gather(
+        client.async_send_scene(SceneEnum.AWAY, 1, panel, timedelta(0)),
+        client.async_send_scene(SceneEnum.STANDBY, 1, panel, timedelta(0)),
+    )
+
+    assert [result.scene for result in results] == ["STANDBY", "STANDBY"]
+    assert client.stats.requests == 1
+    assert client.stats.superseded_scenes == 1
+
+
+async def test_cancelled_caller_keeps_newer_scene(
+    client: LeakDefenseApiClient,
+) -> None:
+    """Cancelling the first caller does not cancel the scene replacing its own."""
+    client.scene_debounce = 0.05
+    panel = make_panel_state(1)
+    first = asyncio.create_task(
+        client.async_send_scene(SceneEnum.AWAY, 1, panel, timedelta(0))
+    )
+    await asyncio.sleep(0)
+    second = asyncio.create_task(
+        client.async_send_scene(SceneEnum.STANDBY, 1, panel, timedelta(0))
+    )
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert (await second).scene == "STANDBY"
+    assert first.cancelled()
+    assert client.stats.requests == 1
+
+
+async def test_full_customer_is_read_again(client: LeakDefenseApiClient) -> None:
+    """Diagnostics read the complete customer without disturbing polls."""
+    polled = await client.async_get_data()
+
+    customer = await client.async_get_full_customer()
+
+    assert customer.email == "owner@example.com"
+    assert [panel.id for panel in customer.panels] == [1, 2]
+    assert client.stats.requests == 2
+    assert await client.async_get_data() is polled
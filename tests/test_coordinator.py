@@ -0,0 +1,94 @@
+"""Tests for the Leak Defense coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.leak_defense.const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    PANEL_REMOVAL_POLLS,
+)
+
+from . import make_customer, make_panel_state
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+SUSPECTED_LEAK = "binary_sensor.panel_1_suspected_leak"
+
+
+@pytest.mark.parametrize("payload_changed", [False, True])
+async def test_leak_suspected_while_panels_stay_equal(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_get_data: AsyncMock,
+    payload_changed: bool,  # noqa: FBT001
+) -> None:
+    """A flow that lasted long enough raises a leak without any field changing."""
+    mock_get_data.return_value = make_customer(make_panel_state(1, flow_value=20.0))
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data.coordinator
+    assert hass.states.get(SUSPECTED_LEAK).state == "off"
+
+    # The flow has been above the trip value for the whole countdown.
+    coordinator.leak_detectors[1]._exceeded_since -= 3600
+    if payload_changed:
+        mock_get_data.return_value = make_customer(make_panel_state(1, flow_value=20.0))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.changed_fields == {}
+    assert hass.states.get(SUSPECTED_LEAK).state == "on"
+
+
+async def test_panel_removed_while_panels_stay_equal(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_get_data: AsyncMock,
+) -> None:
+    """A panel missing for long enough is removed on a poll changing nothing."""
+    coordinator = init_integration.runtime_data.coordinator
+    device_registry = dr.async_get(hass)
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "2")})
+
+    mock_get_data.return_value = make_customer(1)
+    for _ in range(PANEL_REMOVAL_POLLS - 1):
+        await coordinator.async_refresh()
+    assert hass.states.get("sensor.panel_2_flow_value").state == "unknown"
+
+    # The panel has been missing for longer than the removal delay.
+    since, polls = coordinator._missing_panels[2]
+    coordinator._missing_panels[2] = (since - 7200, polls)
+    mock_get_data.return_value = make_customer(1)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.removed_panel_ids == {2}
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "2")}) is None
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "1")})
+
+
+async def test_saving_options_does_not_grow_poll_interval(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Changed interval bounds apply to the base interval, not a grown one."""
+    coordinator = init_integration.runtime_data.coordinator
+
+    for maximum in (600, 900, 1200):
+        hass.config_entries.async_update_entry(
+            init_integration, options={CONF_MAX_UPDATE_INTERVAL: maximum}
+        )
+        await hass.async_block_till_done()
+
+        assert coordinator.max_update_interval == timedelta(seconds=maximum)
+        assert coordinator.update_interval == DEFAULT_UPDATE_INTERVAL
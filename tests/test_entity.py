@@ -0,0 +1,62 @@
+"""Tests for the Leak Defense entities."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.leak_defense.coordinator import _changed_fields
+
+from . import make_customer, make_panel_state
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+FLOW_VALUE = "sensor.panel_1_flow_value"
+TRIP_VALUE = "sensor.panel_1_trip_value"
+
+
+def test_changed_fields() -> None:
+    """Only the fields that differ between two snapshots are reported."""
+    panel = make_panel_state(1)
+
+    assert _changed_fields(panel, panel) == frozenset()
+    assert _changed_fields(panel, make_panel_state(1)) == frozenset()
+    assert _changed_fields(panel, make_panel_state(1, flow_value=2.0)) == {"flow_value"}
+    assert "flow_value" in _changed_fields(None, panel)
+    assert "flow_value" in _changed_fields(panel, None)
+
+
+async def test_unchanged_poll_writes_no_state(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """A poll returning the previous customer does not touch any state."""
+    reported = hass.states.get(FLOW_VALUE).last_reported
+
+    await init_integration.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(FLOW_VALUE).last_reported == reported
+
+
+async def test_entities_skip_unrelated_changes(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_get_data: AsyncMock,
+) -> None:
+    """Only the entities derived from a changed field write their state."""
+    coordinator = init_integration.runtime_data.coordinator
+    trip_reported = hass.states.get(TRIP_VALUE).last_reported
+
+    mock_get_data.return_value = make_customer(make_panel_state(1, flow_value=2.0), 2)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.changed_fields == {1: {"flow_value"}}
+    assert coordinator.panel_changed(1, frozenset({"flow_value"}))
+    assert not coordinator.panel_changed(1, frozenset({"trip_value"}))
+    assert not coordinator.panel_changed(2, frozenset())
+    assert float(hass.states.get(FLOW_VALUE).state) == 2.0
+    assert hass.states.get(TRIP_VALUE).last_reported == trip_reported
@@ -0,0 +1,29 @@
+"""Tests for the per-panel flow history."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.leak_defense.history import FlowHistory
+
+
+def test_volume_is_integrated_between_samples() -> None:
+    """Flow is integrated with the trapezoidal rule, in litres."""
+    history = FlowHistory()
+    history.append(0, 0.0)
+    history.append(60, 2.0)
+    history.append(120, 2.0)
+
+    assert history.volume == pytest.approx(3.0)
+    assert history.mean == pytest.approx(1.0)
+    assert history.maximum == 2.0
+
+
+@pytest.mark.parametrize(("max_gap", "volume"), [(900, 0.0), (3600, 40.0)])
+def test_gaps_longer_than_max_gap_are_skipped(max_gap: float, volume: float) -> None:
+    """A gap is only integrated when it is not longer than ``max_gap``."""
+    history = FlowHistory(max_gap=max_gap)
+    history.append(0, 2.0)
+    history.append(1200, 2.0)
+
+    assert history.volume == pytest.approx(volume)
@@ -0,0 +1,65 @@
+"""Tests for setting up and removing Leak Defense entries."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.leak_defense.const import DOMAIN, STORAGE_SAVE_DELAY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_unload_saves_snapshot(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Unloading writes the snapshot without waiting for the delayed save."""
+    key = f"{DOMAIN}.{init_integration.entry_id}"
+    assert key not in hass_storage
+
+    assert await hass.config_entries.async_unload(init_integration.entry_id)
+
+    assert [panel["id"] for panel in hass_storage[key]["data"]["panels"]] == [1, 2]
+
+
+async def test_remove_deletes_snapshot(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Removing an entry leaves no snapshot, nor a save pending to write one."""
+    await hass.config_entries.async_remove(init_integration.entry_id)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.{init_integration.entry_id}" not in hass_storage
+
+
+async def test_entries_spread_their_polls(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Every entry set up or unloaded shares the poll interval out again."""
+    first = init_integration.runtime_data.coordinator
+    assert first.poll_phase is None
+
+    second_entry = MockConfigEntry(
+        domain=DOMAIN, title="Cabin", data={"token": "other", "device_hash": "other"}
+    )
+    second_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(second_entry.entry_id)
+    second = second_entry.runtime_data.coordinator
+    assert (first.poll_phase, second.poll_phase) == (0, 0.5)
+
+    assert await hass.config_entries.async_unload(init_integration.entry_id)
+    assert second.poll_phase is None
@@ -0,0 +1,46 @@
+"""Tests for the retry, circuit breaker and rate limiting helpers."""
+
+from __future__ import annotations
+
+from custom_components.leak_defense.resilience import (
+    BreakerState,
+    CircuitBreaker,
+    RetryPolicy,
+)
+
+
+def test_backoff_is_bounded() -> None:
+    """Backoff delays stay within the exponential window and the maximum."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+
+    for attempt in range(6):
+        assert 0 <= policy.backoff(attempt) <= min(4.0, 2**attempt)
+
+
+def test_breaker_probes_once_half_open() -> None:
+    """An open breaker lets one probe through, which decides its next state."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    breaker.record_failure()
+
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_breaker_release_allows_another_probe() -> None:
+    """A probe released without an outcome does not block the next one."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.release()
+
+    assert breaker.allow_request()
@@ -0,0 +1,56 @@
+"""Tests for the Leak Defense sensors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.leak_defense.const import DOMAIN
+
+from . import make_customer
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+FLOW_MEAN = "sensor.panel_1_flow_mean"
+TRIP_VALUE = "sensor.panel_1_trip_value"
+
+
+async def test_diagnostic_sensors_are_named_after_the_account(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Each entry's diagnostic sensors get their own entity ids."""
+    entity_registry = er.async_get(hass)
+
+    assert (
+        entity_registry.async_get_entity_id(
+            "sensor", DOMAIN, f"leak_defense_{init_integration.entry_id}_api_latency"
+        )
+        == "sensor.leak_defense_home_api_latency"
+    )
+
+
+@pytest.mark.parametrize("payload_changed", [False, True])
+async def test_flow_history_follows_polls_without_changes(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_get_data: AsyncMock,
+    payload_changed: bool,  # noqa: FBT001
+) -> None:
+    """History sensors take each sample when the panels themselves are equal."""
+    flow_mean_reported = hass.states.get(FLOW_MEAN).last_reported
+    trip_value_reported = hass.states.get(TRIP_VALUE).last_reported
+    if payload_changed:
+        # A new payload that differs only in fields the integration ignores.
+        mock_get_data.return_value = make_customer()
+
+    await init_integration.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(FLOW_MEAN).last_reported > flow_mean_reported
+    assert hass.states.get(TRIP_VALUE).last_reported == trip_value_reported